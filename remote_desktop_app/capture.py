@@ -3,38 +3,158 @@ Screen capture functionality for the remote desktop system
 """
 import asyncio
 import threading
-import queue
+import collections
 import time
 import zlib
 import logging
+import functools
+import struct
 import cv2
 import mss
 import numpy as np
-from typing import Set, Union
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 from aiohttp.web import WebSocketResponse
 import websockets
 from websockets.server import ServerProtocol
 from models import PerformanceConfig, EventType
 from security import SecurityManager, MetricsCollector
+from utils import dumps_json
+
+# zstandard is optional; fall back to zlib when it is not installed
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstd = None
+    ZSTD_AVAILABLE = False
+
+# TurboJPEG (libjpeg-turbo SIMD) is optional; fall back to cv2.imencode
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGRA, TJSAMP_420
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TurboJPEG = None
+    TURBOJPEG_AVAILABLE = False
+
+# simplejpeg bundles libjpeg-turbo in its wheel; used when the system library is missing
+try:
+    from simplejpeg import encode_jpeg
+    SIMPLEJPEG_AVAILABLE = True
+except ImportError:
+    encode_jpeg = None
+    SIMPLEJPEG_AVAILABLE = False
+
+# nvJPEG (CUDA) is optional and only used when a GPU is present
+try:
+    from nvjpeg import NvJpeg
+    NVJPEG_AVAILABLE = True
+except ImportError:
+    NvJpeg = None
+    NVJPEG_AVAILABLE = False
+
+# JPEG start-of-image marker; JPEG payloads are already entropy-coded
+JPEG_SOI = b"\xff\xd8"
+
+# Prepended to every frame: source screen width, height, sequence number and
+# capture time (monotonic microseconds, low 32 bits), all little-endian uint32
+FRAME_HEADER = struct.Struct("<IIII")
+
+
+def _effective_algo(config: PerformanceConfig) -> str:
+    """Resolve the configured compression algorithm against what is installed"""
+    if config.compression_algo == "none" or config.compression_level <= 0:
+        return "none"
+    if config.compression_algo == "zstd" and ZSTD_AVAILABLE:
+        return "zstd"
+    return "zlib"
+
+
+def make_compressor(config: PerformanceConfig):
+    """Create a reusable compress callable for the configured algorithm"""
+    algo = _effective_algo(config)
+    if algo == "none":
+        return None
+    if algo == "zstd":
+        return zstd.ZstdCompressor(level=config.zstd_level).compress
+    return functools.partial(zlib.compress, level=config.compression_level)
+
+
+def compression_label(config: PerformanceConfig) -> str:
+    """Human-readable description of the active compression setting"""
+    algo = _effective_algo(config)
+    if algo == "none" or not (config.compress_frames or config.compress_events):
+        return "Disabled"
+    if algo == "zstd":
+        return f"ZSTD Level {config.zstd_level}"
+    return f"ZLIB Level {config.compression_level}"
 
 
 class ScreenCaptureEngine:
     """High-performance screen capture with multiple monitor support"""
     def __init__(self, config: PerformanceConfig):
         self.config = config
-        self.frame_queue = queue.Queue(maxsize=config.frame_queue_size)
+        # Single producer/consumer: a bounded deque drops the oldest frame on append
+        self.frames = collections.deque(maxlen=config.frame_queue_size)
+        self.dropped_frames = 0
+        # Created in start_capture so they belong to the running event loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._frame_ready: Optional[asyncio.Event] = None
         self.running = False
         self.monitors = []
         self.current_monitor = 0
+        # Frames are JPEG; compression only applies if explicitly enabled for a non-JPEG transport
+        self._compress = make_compressor(config) if config.compress_frames else None
+        self._bgr_buf = None
+        self._resize_buf = None
+        self._prev_raw = None
+        self.last_frame: Optional[bytes] = None
+        # OpenCV encode flags built once; optimize/progressive pinned off (they add encode time)
+        self._jpeg_params = [
+            cv2.IMWRITE_JPEG_QUALITY, int(config.jpeg_quality),
+            cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+            cv2.IMWRITE_JPEG_PROGRESSIVE, 0
+        ]
+        self._thumb_jpeg_params = [
+            cv2.IMWRITE_JPEG_QUALITY, int(config.thumbnail_quality),
+            cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+            cv2.IMWRITE_JPEG_PROGRESSIVE, 0
+        ]
+        self._thumb_buf = None
+        # Set by the server while any client is backpressured
+        self.want_thumbnail = False
+        self._nvj = self._create_nvjpeg()
+        self._tj = self._create_turbojpeg()
+
+    def _create_nvjpeg(self):
+        """Create a GPU JPEG encoder if enabled and a CUDA device is present"""
+        if not (NVJPEG_AVAILABLE and self.config.enable_gpu_encode):
+            return None
+        try:
+            return NvJpeg()
+        except Exception as e:
+            logging.warning("nvJPEG unavailable, using CPU encoder: %s", e)
+            return None
+
+    def _create_turbojpeg(self):
+        """Load libjpeg-turbo if the binding and shared library are present"""
+        if not (TURBOJPEG_AVAILABLE and self.config.use_turbojpeg):
+            return None
+        try:
+            return TurboJPEG()
+        except Exception as e:
+            logging.warning("TurboJPEG unavailable, using fallback encoder: %s", e)
+            return None
 
     def initialize(self):
         """Initialize screen capture"""
         with mss.mss() as sct:
             self.monitors = sct.monitors[1:]  # Skip virtual monitor
-            logging.info(f"Detected {len(self.monitors)} monitors")
+            logging.info("Detected %d monitors", len(self.monitors))
 
     def start_capture(self):
-        """Start screen capture thread"""
+        """Start screen capture thread (must be called from the event loop)"""
+        self._loop = asyncio.get_running_loop()
+        self._frame_ready = asyncio.Event()
         self.running = True
         capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
         capture_thread.start()
@@ -48,52 +168,165 @@ class ScreenCaptureEngine:
     def _capture_loop(self):
         """Main capture loop with performance optimizations"""
         with mss.mss() as sct:
-            monitor = self.monitors[self.current_monitor]
-            frame_time = 1.0 / self.config.max_fps
+            monitor_index = self.current_monitor
+            monitor = self.monitors[monitor_index]
+            frame_time_ns = 1_000_000_000 // self.config.max_fps
+            next_deadline_ns = time.perf_counter_ns() + frame_time_ns
+
+            # Bind hot-path attributes to locals once
+            fps = self.config.max_fps
+            quality = self.config.jpeg_quality
+            optimize = quality < 90
+            grab = self._grab_bgra
+            optimize_image = self._optimize_image
+            encode = functools.partial(self._encode_jpeg, quality=quality, cv2_params=self._jpeg_params)
+            thumbnails_enabled = self.config.thumbnail_width > 0
+            encode_thumbnail = self._encode_thumbnail
+            compress = self._compress
+            frames = self.frames
+            max_frames = frames.maxlen
+            signal_frame = functools.partial(self._loop.call_soon_threadsafe, self._frame_ready.set)
+            now_ns = time.perf_counter_ns
+            sleep = time.sleep
+            pack_header = FRAME_HEADER.pack
+            monotonic_ns = time.monotonic_ns
+            seq = 0
 
             while self.running:
                 try:
-                    start_time = time.time()
-
-                    # Capture screen
-                    img = np.array(sct.grab(monitor))
-                    img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-
-                    # Apply optimizations
-                    if self.config.jpeg_quality < 90:
-                        img = self._optimize_image(img)
+                    # Pick up monitor switches
+                    if self.current_monitor != monitor_index:
+                        monitor_index = self.current_monitor
+                        monitor = self.monitors[monitor_index]
+
+                    # Pick up quality/FPS changes requested by clients
+                    if self.config.jpeg_quality != quality:
+                        quality = self.config.jpeg_quality
+                        optimize = quality < 90
+                        encode = functools.partial(self._encode_jpeg, quality=quality, cv2_params=self._jpeg_params)
+                    if self.config.max_fps != fps:
+                        fps = self.config.max_fps
+                        frame_time_ns = 1_000_000_000 // fps
+
+                    # Capture screen (None when nothing changed since the last frame)
+                    img = grab(sct, monitor)
+
+                    if img is not None:
+                        # Apply optimizations before stripping alpha so fewer pixels are converted
+                        if optimize:
+                            img = optimize_image(img)
+
+                        # Encode frame
+                        frame_data = encode(img)
+
+                        if frame_data:
+                            # Apply compression if enabled (skipped for JPEG, which would not shrink)
+                            if compress and not frame_data.startswith(JPEG_SOI):
+                                frame_data = compress(frame_data)
+
+                            # Screen size rides with each frame so clients map input coordinates without a separate message
+                            seq = (seq + 1) & 0xFFFFFFFF
+                            header = pack_header(monitor['width'], monitor['height'], seq,
+                                                 (monotonic_ns() // 1000) & 0xFFFFFFFF)
+                            frame_data = header + frame_data
+
+                            # Cheaper tier, only produced while some client is falling behind
+                            thumb_data = None
+                            if thumbnails_enabled and self.want_thumbnail:
+                                thumb_data = encode_thumbnail(img)
+                                if thumb_data:
+                                    thumb_data = header + thumb_data
+
+                            self.last_frame = frame_data
+                            if len(frames) == max_frames:
+                                self.dropped_frames += 1
+                            frames.append((frame_data, thumb_data))
+                            signal_frame()
+
+                    # Control frame rate against absolute perf_counter deadlines
+                    slack_ns = next_deadline_ns - now_ns()
+                    if slack_ns > 0:
+                        sleep(slack_ns / 1e9)
+                        next_deadline_ns += frame_time_ns
+                    else:
+                        # Fell behind: resync instead of bursting to catch up
+                        next_deadline_ns = now_ns() + frame_time_ns
 
-                    # Encode frame
-                    result, buffer = cv2.imencode(
-                        ".jpg", 
-                        img, 
-                        [int(cv2.IMWRITE_JPEG_QUALITY), self.config.jpeg_quality]
-                    )
-
-                    if result:
-                        frame_data = buffer.tobytes()
-
-                        # Apply compression if enabled
-                        if self.config.compression_level > 0:
-                            frame_data = zlib.compress(frame_data, level=self.config.compression_level)
+                except Exception as e:
+                    logging.error("Capture error: %s", e)
+                    sleep(0.1)
+                    next_deadline_ns = now_ns() + frame_time_ns
+
+    async def next_frame(self) -> Tuple[bytes, Optional[bytes]]:
+        """Wait for a captured frame and return the oldest (frame, thumbnail) pair"""
+        while not self.frames:
+            # Any set() from the capture thread is scheduled after this clear, so no wakeup is lost
+            self._frame_ready.clear()
+            await self._frame_ready.wait()
+        return self.frames.popleft()
+
+    def _grab_bgra(self, sct, monitor) -> Optional[np.ndarray]:
+        """Grab a frame as a BGRA view over the mss buffer, or None if the screen is unchanged"""
+        shot = sct.grab(monitor)
+        raw = shot.raw
+
+        # bytearray equality is a single memcmp; an idle desktop skips encode and broadcast
+        if raw == self._prev_raw:
+            return None
+        self._prev_raw = raw
+
+        return np.frombuffer(raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+    def _to_bgr(self, bgra: np.ndarray) -> np.ndarray:
+        """Strip alpha into a reusable BGR buffer"""
+        if self._bgr_buf is None or self._bgr_buf.shape[:2] != bgra.shape[:2]:
+            self._bgr_buf = np.empty((bgra.shape[0], bgra.shape[1], 3), dtype=np.uint8)
+
+        cv2.mixChannels([bgra], [self._bgr_buf], [0, 0, 1, 1, 2, 2])
+        return self._bgr_buf
+
+    def _encode_jpeg(self, bgra: np.ndarray, quality: int, cv2_params: list, use_gpu: bool = True) -> Optional[bytes]:
+        """Encode a BGRA frame to JPEG"""
+        if use_gpu and self._nvj is not None:
+            # GPU encode: only the BGR upload and compressed bytes cross PCIe
+            return self._nvj.encode(self._to_bgr(bgra), quality)
+
+        if self._tj is not None:
+            # libjpeg-turbo reads BGRA directly; 4:2:0 without accurate DCT/progressive
+            return self._tj.encode(
+                bgra,
+                quality=quality,
+                pixel_format=TJPF_BGRA,
+                jpeg_subsample=TJSAMP_420,
+                flags=0
+            )
 
-                        # Manage queue
-                        if self.frame_queue.full():
-                            try:
-                                self.frame_queue.get_nowait()
-                            except queue.Empty:
-                                pass
+        if SIMPLEJPEG_AVAILABLE:
+            # Same SIMD libjpeg-turbo without a system dependency; fastdct selects IFAST
+            return encode_jpeg(
+                bgra,
+                quality=quality,
+                colorspace='BGRA',
+                colorsubsampling='420',
+                fastdct=True
+            )
 
-                        self.frame_queue.put(frame_data)
+        # OpenCV's JPEG writer drops alpha row by row, so no full-frame BGR copy is needed
+        result, buffer = cv2.imencode(".jpg", bgra, cv2_params)
+        return buffer.tobytes() if result else None
 
-                    # Control frame rate
-                    elapsed = time.time() - start_time
-                    sleep_time = max(0, frame_time - elapsed)
-                    time.sleep(sleep_time)
+    def _encode_thumbnail(self, bgra: np.ndarray) -> Optional[bytes]:
+        """Encode a small low-quality copy of the frame for backpressured clients"""
+        height, width = bgra.shape[:2]
+        thumb_w = self.config.thumbnail_width
+        if width > thumb_w:
+            thumb_h = max(1, height * thumb_w // width)
+            if self._thumb_buf is None or self._thumb_buf.shape[:2] != (thumb_h, thumb_w):
+                self._thumb_buf = np.empty((thumb_h, thumb_w, 4), dtype=np.uint8)
+            bgra = cv2.resize(bgra, (thumb_w, thumb_h), dst=self._thumb_buf, interpolation=cv2.INTER_AREA)
 
-                except Exception as e:
-                    logging.error(f"Capture error: {e}")
-                    time.sleep(0.1)
+        # CPU encoders only: the thumbnail is cheap and must not thrash the GPU path's BGR buffer
+        return self._encode_jpeg(bgra, self.config.thumbnail_quality, self._thumb_jpeg_params, use_gpu=False)
 
     def _optimize_image(self, img: np.ndarray) -> np.ndarray:
         """Apply image optimizations for performance"""
@@ -101,15 +334,32 @@ class ScreenCaptureEngine:
         height, width = img.shape[:2]
         if width > self.config.downscale_threshold or height > self.config.downscale_threshold:
             scale = min(self.config.downscale_threshold/width, self.config.downscale_threshold/height)
-            img = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            target_w, target_h = round(width * scale), round(height * scale)
+
+            # Resize into a buffer reused across frames (reallocated only on size change)
+            if self._resize_buf is None or self._resize_buf.shape != (target_h, target_w, img.shape[2]):
+                self._resize_buf = np.empty((target_h, target_w, img.shape[2]), dtype=np.uint8)
+            img = cv2.resize(img, (target_w, target_h), dst=self._resize_buf, interpolation=cv2.INTER_AREA)
 
         return img
 
+    def set_quality(self, quality: int):
+        """Change JPEG quality; the capture loop applies it from the next frame"""
+        quality = max(10, min(100, int(quality)))
+        self._jpeg_params[1] = quality
+        self.config.jpeg_quality = quality
+        logging.info("JPEG quality set to %d", quality)
+
+    def set_fps(self, fps: int):
+        """Change the capture frame rate; the capture loop applies it from the next frame"""
+        self.config.max_fps = max(1, min(120, int(fps)))
+        logging.info("Max FPS set to %d", self.config.max_fps)
+
     def switch_monitor(self, monitor_index: int):
         """Switch to different monitor"""
         if 0 <= monitor_index < len(self.monitors):
             self.current_monitor = monitor_index
-            logging.info(f"Switched to monitor {monitor_index}")
+            logging.info("Switched to monitor %d", monitor_index)
 
 
 class EventBroadcaster:
@@ -118,87 +368,193 @@ class EventBroadcaster:
         self.config = config
         self.security = security
         self.clients: Set[Union[WebSocketResponse, ServerProtocol]] = set()
+        # Partitioned by implementation so websockets clients get one broadcast() call per message
+        self._ws_clients: Set[ServerProtocol] = set()
+        # aiohttp clients in struct-of-arrays form: parallel lists of clients and bound
+        # send methods (resolved once at registration), plus an index for swap-pop removal
+        self._client_objs: List[WebSocketResponse] = []
+        self._send_fns: List[Callable[[bytes], Awaitable[None]]] = []
+        self._client_slots: Dict[WebSocketResponse, int] = {}
         self.metrics = MetricsCollector()
+        # The bundled web client reads event batches as JSON text; compress only when opted in
+        self._compress = make_compressor(config.performance) if config.performance.compress_events else None
+        # Bound once: None when encryption is disabled
+        self._encrypt = security.cipher.encrypt if security.cipher else None
+        # True when the last frame broadcast found a client over the backpressure limit
+        self.backpressured = False
+        # Lagging websockets clients: a single pending-frame slot (newest wins) and the task draining it
+        self._pending_frames: Dict[ServerProtocol, bytes] = {}
+        self._drain_tasks: Dict[ServerProtocol, asyncio.Task] = {}
+        # Events waiting for the next batched flush
+        self._pending_events: List[dict] = []
+        self._flush_task: Optional[asyncio.Task] = None
 
     def add_client(self, client: Union[WebSocketResponse, ServerProtocol]):
         """Add new client"""
         self.clients.add(client)
+        if isinstance(client, WebSocketResponse):
+            self._client_slots[client] = len(self._client_objs)
+            self._client_objs.append(client)
+            self._send_fns.append(client.send_bytes)
+        else:
+            self._ws_clients.add(client)
         self.metrics.connected_clients.inc()
-        logging.info(f"Client connected: {client.remote_address if hasattr(client, 'remote_address') else 'Unknown'}")
+        logging.info("Client connected: %s", getattr(client, 'remote_address', 'Unknown'))
 
     def remove_client(self, client: Union[WebSocketResponse, ServerProtocol]):
         """Remove client"""
+        if client not in self.clients:
+            return
         self.clients.discard(client)
+        self._ws_clients.discard(client)
+        self._pending_frames.pop(client, None)
+        drain_task = self._drain_tasks.pop(client, None)
+        if drain_task is not None and drain_task is not asyncio.current_task():
+            drain_task.cancel()
+
+        slot = self._client_slots.pop(client, None)
+        if slot is not None:
+            # Swap-pop: move the last client into the freed slot
+            last_client = self._client_objs.pop()
+            last_send = self._send_fns.pop()
+            if last_client is not client:
+                self._client_objs[slot] = last_client
+                self._send_fns[slot] = last_send
+                self._client_slots[last_client] = slot
         self.metrics.connected_clients.dec()
-        logging.info(f"Client disconnected: {client.remote_address if hasattr(client, 'remote_address') else 'Unknown'}")
+        logging.info("Client disconnected: %s", getattr(client, 'remote_address', 'Unknown'))
 
     async def broadcast_event(self, event_type: EventType, details: dict):
-        """Broadcast event to all clients with compression"""
-        try:
-            timestamp = time.strftime("%H:%M:%S", time.localtime())
-            event = {
-                "timestamp": timestamp,
-                "type": event_type.value,
-                "details": details
-            }
+        """Queue an event; events queued within one flush interval go out as one message"""
+        if not self.clients:
+            return
+
+        self._pending_events.append({
+            "timestamp": time.strftime("%H:%M:%S", time.localtime()),
+            "type": event_type.value,
+            "details": details
+        })
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_events())
+
+    async def _flush_events(self):
+        """Serialize, compress and encrypt the queued events once and send them as a JSON array"""
+        await asyncio.sleep(self.config.performance.event_flush_ms / 1000)
+        self._flush_task = None
+        events, self._pending_events = self._pending_events, []
 
+        try:
             # Serialize and compress
-            json_data = str(event).encode('utf-8')
-            if self.config.performance.compression_level > 0:
-                json_data = zlib.compress(json_data, level=self.config.performance.compression_level)
+            json_data = dumps_json(events)
+            if self._compress:
+                json_data = self._compress(json_data)
 
             # Encrypt if enabled
-            if self.security.cipher:
-                json_data = self.security.encrypt_data(json_data)
+            if self._encrypt:
+                json_data = self._encrypt(json_data)
+
+            # Plain JSON goes out as a text message; binary messages are treated as frames by the client
+            if not self._compress and not self._encrypt:
+                json_data = json_data.decode('utf-8')
 
             # Broadcast to all clients
             if self.clients:
-                await asyncio.gather(
-                    *[self._send_to_client(client, json_data) for client in self.clients],
-                    return_exceptions=True
-                )
+                await self._fan_out(json_data)
 
         except Exception as e:
-            logging.error(f"Broadcast error: {e}")
+            logging.error("Broadcast error: %s", e)
             self.metrics.errors.labels(type='broadcast').inc()
 
-    async def broadcast_frame(self, frame_data: bytes):
-        """Broadcast screen frame with optimizations"""
+    async def broadcast_frame(self, frame_data: bytes, thumb_data: Optional[bytes] = None):
+        """Broadcast screen frame, sending the thumbnail tier to backpressured clients"""
         try:
             if not self.clients:
                 return
 
             # Encrypt if enabled
-            if self.security.cipher:
-                frame_data = self.security.encrypt_data(frame_data)
-
-            # Broadcast to all clients
-            await asyncio.gather(
-                *[self._send_to_client(client, frame_data) for client in self.clients],
-                return_exceptions=True
-            )
+            if self._encrypt:
+                frame_data = self._encrypt(frame_data)
+                if thumb_data is not None:
+                    thumb_data = self._encrypt(thumb_data)
+
+            slow = self._backpressured_clients()
+            self.backpressured = bool(slow)
+
+            if slow:
+                # Lagging clients get the newest frame (thumbnail tier if available) through their
+                # own pending slot; frames they could not take in time are overwritten, not queued
+                lagging_data = thumb_data if thumb_data is not None else frame_data
+                pending = self._pending_frames
+                for client in slow:
+                    pending[client] = lagging_data
+                    if client not in self._drain_tasks:
+                        self._drain_tasks[client] = asyncio.create_task(self._drain(client))
+                await self._fan_out(frame_data, self._ws_clients - slow)
+            else:
+                await self._fan_out(frame_data)
 
             self.metrics.frame_sent.inc()
             self.metrics.frame_size.observe(len(frame_data))
 
         except Exception as e:
-            logging.error(f"Frame broadcast error: {e}")
+            logging.error("Frame broadcast error: %s", e)
             self.metrics.errors.labels(type='frame').inc()
 
-    async def _send_to_client(self, client: Union[WebSocketResponse, ServerProtocol], data: bytes):
-        """Send data to a client, handling different WebSocket implementations"""
+    def _backpressured_clients(self) -> Set[ServerProtocol]:
+        """websockets clients over the backpressure limit, or still draining their pending frame"""
+        limit = self.config.performance.backpressure_bytes
+        if not limit or not self._ws_clients:
+            return set()
+        slow = {
+            client for client in self._ws_clients
+            if client.transport.get_write_buffer_size() > limit
+        }
+        slow.update(self._drain_tasks)
+        return slow
+
+    async def _drain(self, client: ServerProtocol):
+        """Send a lagging client its pending frame until none is left, one send in flight at a time"""
+        timeout = self.config.performance.send_timeout_ms / 1000
+        pending = self._pending_frames
         try:
-            if isinstance(client, WebSocketResponse):
-                # aiohttp WebSocket
-                if isinstance(data, str):
-                    await client.send_str(data)
-                else:
-                    await client.send_bytes(data)
-            else:
-                # websockets library
-                await client.send(data)
+            while True:
+                data = pending.pop(client, None)
+                if data is None:
+                    break
+                try:
+                    # send() waits for the transport to drain; a newer frame replaces any that arrive meanwhile
+                    await asyncio.wait_for(client.send(data), timeout)
+                except asyncio.TimeoutError:
+                    continue
         except Exception as e:
-            logging.error(f"Error sending to client: {e}")
-            # Only try to remove the client if it still exists in our clients set
-            if client in self.clients:
-                self.remove_client(client)
\ No newline at end of file
+            logging.error("Error sending to client: %s", e)
+            self.remove_client(client)
+        finally:
+            if self._drain_tasks.get(client) is asyncio.current_task():
+                del self._drain_tasks[client]
+
+    async def _fan_out(self, data: Union[bytes, str], ws_clients: Optional[Set[ServerProtocol]] = None):
+        """Send data to every client; websockets connections go through one broadcast() call"""
+        if ws_clients is None:
+            ws_clients = self._ws_clients
+        if ws_clients:
+            websockets.broadcast(ws_clients, data)
+
+        if self._send_fns:
+            # Bound send_bytes covers frames; the rare text message resolves send_str here
+            sends = self._send_fns if isinstance(data, bytes) else [c.send_str for c in self._client_objs]
+            # Await each send in turn: with room in the transport buffer the await completes
+            # without yielding, so no Tasks or result list are created per broadcast
+            failed = None
+            for client, send in zip(tuple(self._client_objs), tuple(sends)):
+                try:
+                    await send(data)
+                except Exception as e:
+                    logging.error("Error sending to client: %s", e)
+                    if failed is None:
+                        failed = []
+                    failed.append(client)
+
+            if failed:
+                for client in failed:
+                    self.remove_client(client)
@@ -6,6 +6,7 @@ import os
 from pathlib import Path
 from typing import Optional
 from models import SystemConfig
+from utils import loads_json
 
 
 class ConfigManager:
@@ -13,6 +14,28 @@ class ConfigManager:
 
     DEFAULT_CONFIG_PATH = "config/remote-desktop.json"
 
+    # (section, field, min, max, label) checked by validate_config
+    RANGE_CHECKS = (
+        ("server", "http_port", 1, 65535, "HTTP port"),
+        ("server", "ws_port", 1, 65535, "WebSocket port"),
+        ("performance", "max_fps", 1, 120, "Max FPS"),
+        ("performance", "jpeg_quality", 10, 100, "JPEG quality"),
+        ("performance", "compression_level", 0, 9, "Compression level"),
+        ("performance", "zstd_level", 1, 22, "ZSTD level"),
+        ("performance", "send_timeout_ms", 1, 10000, "Send timeout"),
+        ("performance", "event_flush_ms", 0, 1000, "Event flush interval"),
+        ("performance", "thumbnail_width", 0, 7680, "Thumbnail width"),
+        ("performance", "thumbnail_quality", 10, 100, "Thumbnail quality"),
+        ("performance", "backpressure_bytes", 0, 1073741824, "Backpressure threshold"),
+    )
+
+    # (section, field, allowed values, label) checked by validate_config
+    CHOICE_CHECKS = (
+        ("performance", "compression_algo", ("zstd", "zlib", "none"), "Compression algorithm"),
+        ("security", "cipher_mode", ("fernet", "aesgcm", "chacha20"), "Cipher mode"),
+        ("logging", "log_level", ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"), "Log level"),
+    )
+
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or self.DEFAULT_CONFIG_PATH
         self.config = self._load_config()
@@ -21,8 +44,8 @@ class ConfigManager:
         """Load configuration from file or create default"""
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    config_dict = json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    config_dict = loads_json(f.read())
                 return SystemConfig.from_dict(config_dict)
             else:
                 # Create default config
@@ -50,27 +73,17 @@ class ConfigManager:
     def validate_config(self) -> bool:
         """Validate configuration settings"""
         try:
-            # Validate server settings
-            if not (1 <= self.config.server.http_port <= 65535):
-                print("Error: HTTP port must be between 1 and 65535")
-                return False
-
-            if not (1 <= self.config.server.ws_port <= 65535):
-                print("Error: WebSocket port must be between 1 and 65535")
-                return False
-
-            # Validate performance settings
-            if not (1 <= self.config.performance.max_fps <= 120):
-                print("Error: Max FPS must be between 1 and 120")
-                return False
-
-            if not (10 <= self.config.performance.jpeg_quality <= 100):
-                print("Error: JPEG quality must be between 10 and 100")
-                return False
+            # Validate numeric ranges
+            for section, name, low, high, label in self.RANGE_CHECKS:
+                if not (low <= getattr(getattr(self.config, section), name) <= high):
+                    print(f"Error: {label} must be between {low} and {high}")
+                    return False
 
-            if not (0 <= self.config.performance.compression_level <= 9):
-                print("Error: Compression level must be between 0 and 9")
-                return False
+            # Validate enumerated settings
+            for section, name, choices, label in self.CHOICE_CHECKS:
+                if getattr(getattr(self.config, section), name) not in choices:
+                    print(f"Error: {label} must be one of {list(choices)}")
+                    return False
 
             # Validate security settings
             if self.config.security.enable_ssl:
@@ -82,12 +95,6 @@ class ConfigManager:
                     print("Error: SSL key path is required when SSL is enabled")
                     return False
 
-            # Validate logging settings
-            valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-            if self.config.logging.log_level not in valid_log_levels:
-                print(f"Error: Log level must be one of {valid_log_levels}")
-                return False
-
             return True
         except Exception as e:
             print(f"Error validating config: {e}")
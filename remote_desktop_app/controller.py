@@ -2,6 +2,7 @@
 Input control for the remote desktop system
 """
 import asyncio
+import struct
 import time
 import logging
 import random
@@ -83,6 +84,64 @@ except ImportError as e:
     PYNPUT_AVAILABLE = False
 
 
+# Built once at import: key/button names sent by the web client
+_SPECIAL_KEYS = {
+    'space': Key.space,
+    'enter': Key.enter,
+    'tab': Key.tab,
+    'backspace': Key.backspace,
+    'delete': Key.delete,
+    'escape': Key.esc,
+    'esc': Key.esc,
+    'shift': Key.shift,
+    'ctrl': Key.ctrl,
+    'alt': Key.alt,
+    'cmd': Key.cmd,
+    'win': Key.cmd,
+    'caps_lock': Key.caps_lock,
+    'num_lock': Key.num_lock,
+    'scroll_lock': Key.scroll_lock,
+    'pause': Key.pause,
+    'insert': Key.insert,
+    'home': Key.home,
+    'end': Key.end,
+    'page_up': Key.page_up,
+    'page_down': Key.page_down,
+    'left': Key.left,
+    'right': Key.right,
+    'up': Key.up,
+    'down': Key.down,
+    'f1': Key.f1,
+    'f2': Key.f2,
+    'f3': Key.f3,
+    'f4': Key.f4,
+    'f5': Key.f5,
+    'f6': Key.f6,
+    'f7': Key.f7,
+    'f8': Key.f8,
+    'f9': Key.f9,
+    'f10': Key.f10,
+    'f11': Key.f11,
+    'f12': Key.f12,
+}
+
+_BUTTON_MAP = {
+    "left": Button.left,
+    "right": Button.right,
+    "middle": Button.middle
+}
+
+# Binary input record sent by the web client: opcode, button, x, y, dy (little-endian)
+INPUT_RECORD = struct.Struct("<BBhhh")
+OP_MOVE = 1
+OP_CLICK = 2
+OP_DOUBLE_CLICK = 3
+OP_SCROLL = 4
+
+# Button byte in an input record
+_BUTTON_CODES = (Button.left, Button.right, Button.middle)
+
+
 class InputController:
     """High-precision input control with debouncing"""
     def __init__(self, config: SystemConfig):
@@ -90,6 +149,9 @@ class InputController:
         self.keyboard = KController()
         self.mouse = MController()
         self.last_move_time = 0
+        self._throttle_ns = config.performance.mouse_throttle_ms * 1_000_000
+        self._pending_move = None
+        self._move_flush = None
         self.auto_click_active = False
 
     async def handle_command(self, command: dict):
@@ -125,98 +187,79 @@ class InputController:
                 self.auto_click_active = False
 
         except Exception as e:
-            logging.error(f"Command handling error: {e}")
+            logging.error("Command handling error: %s", e)
+
+    def handle_records(self, data: bytes):
+        """Apply a run of packed INPUT_RECORDs (mouse move, click, double click, scroll)"""
+        for op, button, x, y, dy in INPUT_RECORD.iter_unpack(data):
+            if op == OP_MOVE:
+                self._move_mouse(x, y)
+            elif op == OP_CLICK:
+                self._click_mouse(_BUTTON_CODES[button] if button < len(_BUTTON_CODES) else Button.left)
+            elif op == OP_DOUBLE_CLICK:
+                self._double_click()
+            elif op == OP_SCROLL:
+                self._scroll(dy)
+            else:
+                logging.warning("Unknown input opcode: %d", op)
 
     def _move_mouse(self, x: int, y: int):
-        """Move mouse with throttling"""
-        current_time = time.time()
-        if current_time - self.last_move_time > (self.config.performance.mouse_throttle_ms / 1000):
-            self.mouse.position = (x, y)
-            self.last_move_time = current_time
+        """Move mouse, coalescing bursts into at most one move per throttle window"""
+        self._pending_move = (x, y)
+        if self._move_flush is not None:
+            # A flush is already scheduled and will apply the latest position
+            return
+
+        wait_ns = self.last_move_time + self._throttle_ns - time.monotonic_ns()
+        if wait_ns <= 0:
+            self._flush_move()
+        else:
+            self._move_flush = asyncio.get_running_loop().call_later(wait_ns / 1e9, self._flush_move)
+
+    def _flush_move(self):
+        """Apply the most recent pending mouse position"""
+        self._move_flush = None
+        if self._pending_move is not None:
+            self.mouse.position = self._pending_move
+            self._pending_move = None
+            self.last_move_time = time.monotonic_ns()
+
+    def _settle_move(self):
+        """Apply a throttled move now, so a following click or scroll lands where it was aimed"""
+        if self._move_flush is not None:
+            self._move_flush.cancel()
+        self._flush_move()
 
     def _click_mouse(self, button: Button):
         """Click mouse with specified button"""
+        self._settle_move()
         self.mouse.click(button)
 
     def _double_click(self):
         """Perform double click"""
+        self._settle_move()
         self.mouse.click(Button.left)
         time.sleep(0.1)
         self.mouse.click(Button.left)
 
     def _scroll(self, dy: int):
         """Scroll mouse wheel"""
+        self._settle_move()
         self.mouse.scroll(0, dy)
 
     def _press_key(self, key: str):
         """Press and release key"""
         try:
-            # Handle special keys by converting them to the appropriate Key object
-            if isinstance(key, str):
-                # Map special keys to their Key objects
-                special_keys = {
-                    'space': Key.space,
-                    'enter': Key.enter,
-                    'tab': Key.tab,
-                    'backspace': Key.backspace,
-                    'delete': Key.delete,
-                    'escape': Key.esc,
-                    'esc': Key.esc,
-                    'shift': Key.shift,
-                    'ctrl': Key.ctrl,
-                    'alt': Key.alt,
-                    'cmd': Key.cmd,
-                    'win': Key.cmd,
-                    'caps_lock': Key.caps_lock,
-                    'num_lock': Key.num_lock,
-                    'scroll_lock': Key.scroll_lock,
-                    'pause': Key.pause,
-                    'insert': Key.insert,
-                    'home': Key.home,
-                    'end': Key.end,
-                    'page_up': Key.page_up,
-                    'page_down': Key.page_down,
-                    'left': Key.left,
-                    'right': Key.right,
-                    'up': Key.up,
-                    'down': Key.down,
-                    'f1': Key.f1,
-                    'f2': Key.f2,
-                    'f3': Key.f3,
-                    'f4': Key.f4,
-                    'f5': Key.f5,
-                    'f6': Key.f6,
-                    'f7': Key.f7,
-                    'f8': Key.f8,
-                    'f9': Key.f9,
-                    'f10': Key.f10,
-                    'f11': Key.f11,
-                    'f12': Key.f12,
-                }
-                
-                # If the key is a special key, use the Key object
-                if key.lower() in special_keys:
-                    key_obj = special_keys[key.lower()]
-                    self.keyboard.press(key_obj)
-                    self.keyboard.release(key_obj)
-                else:
-                    # For regular characters, just type them
-                    self.keyboard.press(key)
-                    self.keyboard.release(key)
-            else:
-                self.keyboard.press(key)
-                self.keyboard.release(key)
+            # Map special keys to their Key objects; regular characters are typed as-is
+            key_obj = _SPECIAL_KEYS.get(key.lower(), key) if isinstance(key, str) else key
+            self.keyboard.press(key_obj)
+            self.keyboard.release(key_obj)
         except Exception as e:
-            logging.error(f"Key press error: {e}")
+            logging.error("Key press error: %s", e)
 
     def _parse_button(self, button_str: str) -> Button:
         """Parse button string to Button enum"""
-        button_map = {
-            "left": Button.left,
-            "right": Button.right,
-            "middle": Button.middle
-        }
-        return button_map.get(button_str.lower(), Button.left)
+        return _BUTTON_MAP.get(button_str.lower(), Button.left)
 
     async def _auto_click_loop(self):
         """Auto-click loop with randomization"""
@@ -233,5 +276,5 @@ class InputController:
                 await asyncio.sleep(delay)
 
             except Exception as e:
-                logging.error(f"Auto-click error: {e}")
+                logging.error("Auto-click error: %s", e)
                 break
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 Data models and enumerations for the remote desktop system
 """
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from enum import Enum
 from typing import Dict, Any
 
@@ -29,11 +29,22 @@ class PerformanceConfig:
     """Performance optimization settings"""
     max_fps: int = 30
     jpeg_quality: int = 75
-    compression_level: int = 6  # ZLIB compression level (0-9)
+    compression_level: int = 6  # ZLIB compression level (0-9), 0 disables compression
+    compression_algo: str = "zstd"  # "zstd", "zlib" or "none"; zstd falls back to zlib if not installed
+    zstd_level: int = 3  # ZSTD level; 1-5 is the realtime tier
+    compress_frames: bool = False  # JPEG frames are already entropy-coded
+    compress_events: bool = False  # Off until the web client can decode compressed event batches
     frame_queue_size: int = 3
     mouse_throttle_ms: int = 16
+    event_flush_ms: int = 10  # Events within this window are batched into one message
     enable_h264: bool = False  # Future feature flag
+    enable_gpu_encode: bool = True  # Use nvJPEG when a CUDA GPU is available
+    use_turbojpeg: bool = True  # Use libjpeg-turbo via PyTurboJPEG when installed
     downscale_threshold: int = 1920  # Downscale if width > this value
+    thumbnail_width: int = 640  # Width of the low-quality tier for slow clients, 0 disables it
+    thumbnail_quality: int = 40
+    backpressure_bytes: int = 1048576  # Client write buffer size that selects the thumbnail tier; 0 disables
+    send_timeout_ms: int = 250  # Per-send limit for lagging clients before their next frame is tried
 
 
 @dataclass
@@ -43,6 +54,7 @@ class SecurityConfig:
     ssl_cert_path: str = None
     ssl_key_path: str = None
     encryption_key: str = None
+    cipher_mode: str = "fernet"  # "fernet", "aesgcm" (AES-NI accelerated AEAD) or "chacha20" (ChaCha20-Poly1305)
     auth_required: bool = False
     auth_token: str = None
     allowed_ips: list = field(default_factory=list)
@@ -55,6 +67,7 @@ class FeatureConfig:
     enable_audio: bool = False
     enable_clipboard: bool = True
     enable_file_transfer: bool = True
+    file_transfer_root: str = "."  # Downloads via /file are confined to this directory
     enable_session_recording: bool = False
     enable_multi_monitor: bool = True
     enable_auto_click: bool = True
@@ -72,6 +85,19 @@ class LoggingConfig:
     enable_error_log: bool = True
 
 
+# SystemConfig section name -> (section class, its field names), computed once at import
+_SECTIONS = {
+    name: (section_cls, frozenset(f.name for f in fields(section_cls)))
+    for name, section_cls in (
+        ('server', ServerConfig),
+        ('performance', PerformanceConfig),
+        ('security', SecurityConfig),
+        ('features', FeatureConfig),
+        ('logging', LoggingConfig),
+    )
+}
+
+
 @dataclass
 class SystemConfig:
     """Main configuration container"""
@@ -84,29 +110,17 @@ class SystemConfig:
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'SystemConfig':
         """Create config from dictionary"""
-        server_config = ServerConfig(**config_dict.get('server', {}))
-        performance_config = PerformanceConfig(**config_dict.get('performance', {}))
-        security_config = SecurityConfig(**config_dict.get('security', {}))
-        feature_config = FeatureConfig(**config_dict.get('features', {}))
-        logging_config = LoggingConfig(**config_dict.get('logging', {}))
-
-        return cls(
-            server=server_config,
-            performance=performance_config,
-            security=security_config,
-            features=feature_config,
-            logging=logging_config
-        )
+        # Unknown (stale or misspelled) keys are dropped instead of failing the whole load
+        sections = {}
+        for name, (section_cls, known) in _SECTIONS.items():
+            values = config_dict.get(name, {})
+            sections[name] = section_cls(**{k: v for k, v in values.items() if k in known})
+        return cls(**sections)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary"""
-        return {
-            'server': self.server.__dict__,
-            'performance': self.performance.__dict__,
-            'security': self.security.__dict__,
-            'features': self.features.__dict__,
-            'logging': self.logging.__dict__
-        }
+        # asdict recurses into the section dataclasses and copies their lists
+        return asdict(self)
 
 
 class EventType(Enum):
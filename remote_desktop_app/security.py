@@ -1,9 +1,13 @@
 """
 Security and encryption for the remote desktop system
 """
+import os
 import ssl
+import base64
+import itertools
 from typing import Optional
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
 from models import SecurityConfig
 from prometheus_client import Counter, Histogram
 
@@ -13,11 +17,30 @@ class MetricsCollector:
     def __init__(self):
         self.connected_clients = Counter('rd_connected_clients', 'Number of connected clients')
         self.frame_sent = Counter('rd_frames_sent', 'Total frames sent')
+        self.frames_dropped = Counter('rd_frames_dropped', 'Captured frames dropped from a full frame queue')
         self.frame_size = Histogram('rd_frame_size_bytes', 'Frame size in bytes')
         self.latency = Histogram('rd_latency_ms', 'Request latency in ms')
         self.errors = Counter('rd_errors', 'Total errors', ['type'])
 
 
+class AEADCipher:
+    """AEAD cipher with Fernet's encrypt/decrypt interface; output is nonce || ciphertext"""
+    NONCE_SIZE = 12
+
+    def __init__(self, aead):
+        self._aead = aead
+        self._nonce_prefix = os.urandom(4)
+        self._counter = itertools.count()
+
+    def encrypt(self, data: bytes) -> bytes:
+        # Random per-instance prefix + 64-bit counter: nonces never repeat under one key
+        nonce = self._nonce_prefix + next(self._counter).to_bytes(8, 'big')
+        return nonce + self._aead.encrypt(nonce, data, None)
+
+    def decrypt(self, data: bytes) -> bytes:
+        return self._aead.decrypt(data[:self.NONCE_SIZE], data[self.NONCE_SIZE:], None)
+
+
 class SecurityManager:
     """Enterprise-grade security management"""
     def __init__(self, config: SecurityConfig):
@@ -25,11 +48,22 @@ class SecurityManager:
         self.cipher = None
         if config.encryption_key:
             try:
-                self.cipher = Fernet(config.encryption_key.encode())
+                self.cipher = self._create_cipher(config)
             except Exception as e:
                 print(f"Error initializing encryption: {e}")
                 self.cipher = None
 
+    @staticmethod
+    def _create_cipher(config: SecurityConfig):
+        """Create the cipher selected by cipher_mode"""
+        if config.cipher_mode == "aesgcm":
+            # urlsafe-base64 key of 16, 24 or 32 bytes (AES-128/192/256); a Fernet key also works
+            return AEADCipher(AESGCM(base64.urlsafe_b64decode(config.encryption_key)))
+        if config.cipher_mode == "chacha20":
+            # urlsafe-base64 32-byte key (a Fernet key works); fastest choice on CPUs without AES-NI
+            return AEADCipher(ChaCha20Poly1305(base64.urlsafe_b64decode(config.encryption_key)))
+        return Fernet(config.encryption_key.encode())
+
     def encrypt_data(self, data: bytes) -> bytes:
         """Encrypt data if encryption is enabled"""
         if self.cipher:
@@ -48,6 +82,11 @@ class SecurityManager:
             return None
 
         context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        # Every supported browser speaks TLS 1.3: one-round-trip handshakes and AEAD-only suites
+        if ssl.HAS_TLSv1_3:
+            context.minimum_version = ssl.TLSVersion.TLSv1_3
+        # Payloads are already JPEG or app-level compressed
+        context.options |= ssl.OP_NO_COMPRESSION
         context.load_cert_chain(
             certfile=self.config.ssl_cert_path,
             keyfile=self.config.ssl_key_path
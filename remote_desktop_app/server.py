@@ -2,27 +2,48 @@
 Main server for the remote desktop system
 """
 import asyncio
-import json
-import time
 import logging
 import sys
 import os
 import argparse
+import queue
+import socket
 import zlib
 from pathlib import Path
-from typing import Optional
-from aiohttp import web
-from aiohttp.web import Application
-import websockets
-from websockets.server import ServerProtocol
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
 from models import SystemConfig
 from config import ConfigManager
-from capture import ScreenCaptureEngine, EventBroadcaster
-from controller import InputController
-from security import SecurityManager
-from web import WebInterface
-from utils import get_local_ip, is_port_available, find_available_port, kill_process_on_port
-from prometheus_client import start_http_server
+from utils import dumps_json_text, loads_json, get_local_ip, bind_tcp_socket, is_port_available, find_available_port, kill_process_on_port
+
+# The server stack (aiohttp, websockets, OpenCV/numpy/mss, pynput, prometheus_client) is
+# imported by RemoteDesktopServer itself, so the CLI utility commands start without it
+if TYPE_CHECKING:
+    from websockets.server import ServerProtocol
+
+# uvloop is optional (not available on Windows); fall back to the default loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
+# Serialized once; pings arrive every two seconds from each client
+PONG_MESSAGE = dumps_json_text({"type": "pong"})
+
+# Retry delay range (seconds) for frame_broadcast_loop after an unexpected error
+FRAME_LOOP_BACKOFF_MIN = 0.001
+FRAME_LOOP_BACKOFF_MAX = 0.1
+
+# Decompressed bytes produced per step when unpacking a file transfer
+FILE_CHUNK_SIZE = 64 * 1024
+
+# First byte of a binary client message
+MSG_PING = 0x00
+MSG_INPUT = 0x01
+MSG_FILE_TRANSFER = 0x02
 
 
 class RemoteDesktopServer:
@@ -39,6 +60,11 @@ class RemoteDesktopServer:
         # Initialize logging based on config
         self._setup_logging()
 
+        from capture import ScreenCaptureEngine, EventBroadcaster
+        from controller import InputController
+        from security import SecurityManager
+        from web import WebInterface
+
         # Initialize components with config
         self.security = SecurityManager(self.config.security)
         self.capture_engine = ScreenCaptureEngine(self.config.performance)
@@ -46,107 +72,171 @@ class RemoteDesktopServer:
         self.input_controller = InputController(self.config)
         self.web_interface = WebInterface(self.config)
 
+        # Binary client messages are routed by their first byte
+        self._binary_handlers = {
+            MSG_PING: self._handle_ping,
+            MSG_INPUT: self._handle_input_records,
+        }
+        if self.config.features.enable_file_transfer:
+            self._binary_handlers[MSG_FILE_TRANSFER] = self._handle_file_transfer
+
         # Initialize metrics if enabled
         if self.config.server.metrics_port > 0:
+            from prometheus_client import start_http_server
             start_http_server(self.config.server.metrics_port)
-            logging.info(f"Metrics server started on port {self.config.server.metrics_port}")
+            logging.info("Metrics server started on port %d", self.config.server.metrics_port)
 
     def _setup_logging(self):
         """Setup logging based on configuration"""
         log_config = self.config.logging
 
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [
+            RotatingFileHandler(
+                log_config.log_file,
+                maxBytes=log_config.log_max_size * 1024 * 1024,
+                backupCount=log_config.log_backup_count
+            ),
+            logging.StreamHandler()
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        # Callers (including the capture thread) only enqueue; file/console I/O runs on the listener thread
+        log_queue = queue.SimpleQueue()
+        self._log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._log_listener.start()
+
+        # The queue handler only renders the message (and traceback); the listener's handlers add
+        # the timestamp/level prefix, so lines are not prefixed twice
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
         logging.basicConfig(
             level=getattr(logging, log_config.log_level),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_config.log_file),
-                logging.StreamHandler()
-            ]
+            handlers=[queue_handler]
         )
         logging.info("Remote Desktop Server starting with configuration...")
 
     async def start(self):
         """Start the remote desktop server"""
-        # Initialize screen capture
-        self.capture_engine.initialize()
-        self.capture_engine.start_capture()
+        from aiohttp import web
+        import websockets
+
+        # Small default executor: only occasional blocking work is offloaded
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=2, thread_name_prefix="rd-worker")
+        )
 
         # Find available ports
         host = self.config.server.host
 
-        # Try to find available HTTP port
-        http_port = self._find_available_port(
-            host, 
+        # Bind the HTTP and WebSocket sockets now and hand them to the servers, so the
+        # port cannot be taken between choosing it and listening on it
+        http_sock = self._bind_port(
+            host,
             self.config.server.http_port,
             self.config.server.http_port_fallback_start,
             self.config.server.http_port_fallback_end
         )
 
-        if http_port is None:
+        if http_sock is None:
             logging.error("No available HTTP port found in the specified range")
+            self._log_listener.stop()
             return
 
-        # Try to find available WebSocket port
-        ws_port = self._find_available_port(
+        ws_sock = self._bind_port(
             host,
             self.config.server.ws_port,
             self.config.server.ws_port_fallback_start,
             self.config.server.ws_port_fallback_end
         )
 
-        if ws_port is None:
+        if ws_sock is None:
             logging.error("No available WebSocket port found in the specified range")
+            http_sock.close()
+            self._log_listener.stop()
             return
 
-        # Try to find available metrics port if enabled
-        metrics_port = None
-        if self.config.server.metrics_port > 0:
-            metrics_port = self._find_available_port(
-                host,
-                self.config.server.metrics_port,
-                self.config.server.metrics_port_fallback_start,
-                self.config.server.metrics_port_fallback_end
-            )
-            
-            if metrics_port is None:
-                logging.warning("No available metrics port found, disabling metrics")
-
-        # Update config with actual ports
-        self.config.server.http_port = http_port
-        self.config.server.ws_port = ws_port
-        if metrics_port is not None:
-            self.config.server.metrics_port = metrics_port
-
-        # Create web application
-        app = Application()
-        app.router.add_get('/', self.web_interface.handle_http_request)
-        app.router.add_get('/file', self.web_interface.handle_file)
-
-        # Setup SSL context if enabled
-        ssl_context = self.security.create_ssl_context()
-
-        # Start HTTP server
-        runner = web.AppRunner(app)
-        await runner.setup()
-
-        http_site = web.TCPSite(
-            runner, 
-            host, 
-            http_port,
-            ssl_context=ssl_context
-        )
-        await http_site.start()
+        # Enumerate monitors in the executor; it overlaps with the metrics probe and setting up the app
+        capture_init = asyncio.get_running_loop().run_in_executor(None, self.capture_engine.initialize)
 
-        # Start WebSocket server
-        ws_server = await websockets.serve(
-            self.handle_websocket,
-            host,
-            ws_port,
-            ssl=ssl_context
-        )
+        runner = None
+        try:
+            http_port = http_sock.getsockname()[1]
+            ws_port = ws_sock.getsockname()[1]
+
+            # Try to find available metrics port if enabled
+            metrics_port = None
+            if self.config.server.metrics_port > 0:
+                metrics_port = self._find_available_port(
+                    host,
+                    self.config.server.metrics_port,
+                    self.config.server.metrics_port_fallback_start,
+                    self.config.server.metrics_port_fallback_end
+                )
+            
+                if metrics_port is None:
+                    logging.warning("No available metrics port found, disabling metrics")
+
+            # Update config with actual ports
+            self.config.server.http_port = http_port
+            self.config.server.ws_port = ws_port
+            if metrics_port is not None:
+                self.config.server.metrics_port = metrics_port
+
+            # Create web application
+            app = web.Application()
+            app.router.add_get('/', self.web_interface.handle_http_request)
+            app.router.add_get('/file', self.web_interface.handle_file)
+            app.router.add_get('/static/{name}', self.web_interface.handle_static)
+
+            # Setup SSL context if enabled
+            ssl_context = self.security.create_ssl_context()
+
+            # Start HTTP server
+            runner = web.AppRunner(app)
+            # Wait for both even if one fails, so monitor enumeration never outlives a failed start
+            results = await asyncio.gather(capture_init, runner.setup(), return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+            # Start screen capture (needs the monitor list; creates its wake-up event on this loop)
+            self.capture_engine.start_capture()
+
+            http_site = web.SockSite(
+                runner,
+                http_sock,
+                ssl_context=ssl_context
+            )
+            await http_site.start()
+
+            # Start WebSocket server
+            # No permessage-deflate: broadcast() sends per connection, so every client would
+            # deflate each already-compressed JPEG frame again
+            ws_server = await websockets.serve(
+                self.handle_websocket,
+                sock=ws_sock,
+                ssl=ssl_context,
+                compression=None
+            )
+        except BaseException:
+            # Startup failed part-way: release what was set up, since _cleanup will not run
+            logging.exception("Server startup failed")
+            # Let monitor enumeration finish so it never outlives a failed start
+            await asyncio.gather(capture_init, return_exceptions=True)
+            self.capture_engine.stop_capture()
+            http_sock.close()
+            ws_sock.close()
+            try:
+                if runner is not None:
+                    await runner.cleanup()
+            finally:
+                self._log_listener.stop()
+            raise
 
         # Start frame broadcaster
-        asyncio.create_task(self.frame_broadcast_loop())
+        frame_task = asyncio.create_task(self.frame_broadcast_loop())
 
         # Print server info
         self._print_server_info()
@@ -160,114 +250,143 @@ class RemoteDesktopServer:
         except KeyboardInterrupt:
             logging.info("Shutting down server...")
         finally:
-            await self._cleanup(runner, ws_server)
+            await self._cleanup(runner, ws_server, frame_task)
+
+    def _bind_port(self, host: str, preferred_port: int, fallback_start: int, fallback_end: int) -> Optional[socket.socket]:
+        """Bind the preferred port, or else the first free port in the fallback range"""
+        sock = bind_tcp_socket(host, preferred_port)
+        if sock is not None:
+            return sock
+
+        # Held by a live process: use a fallback port (use --kill-port to reclaim it explicitly)
+        logging.warning("Port %d is in use, trying fallback ports %d-%d", preferred_port, fallback_start, fallback_end)
+        for port in range(fallback_start, fallback_end + 1):
+            sock = bind_tcp_socket(host, port)
+            if sock is not None:
+                return sock
+        return None
 
     def _find_available_port(self, host: str, preferred_port: int, fallback_start: int, fallback_end: int) -> Optional[int]:
         """Find an available port, trying preferred first then fallback range"""
-        # First try the preferred port
+        # First try the preferred port. The probe binds with SO_REUSEADDR, as the asyncio servers
+        # do on POSIX, so sockets left in TIME_WAIT by a previous run do not block a restart
         if is_port_available(host, preferred_port):
             return preferred_port
 
-        # If preferred port is not available, try to kill the process using it
-        if kill_process_on_port(preferred_port):
-            # Wait a moment for the process to fully terminate
-            time.sleep(1)
-            # Try the preferred port again
-            if is_port_available(host, preferred_port):
-                return preferred_port
-
-        # If still not available, try fallback ports
-        logging.warning(f"Port {preferred_port} is in use, trying fallback ports {fallback_start}-{fallback_end}")
+        # Held by a live process: use a fallback port (use --kill-port to reclaim it explicitly)
+        logging.warning("Port %d is in use, trying fallback ports %d-%d", preferred_port, fallback_start, fallback_end)
         return find_available_port(host, fallback_start, fallback_end)
 
-    async def handle_websocket(self, websocket: ServerProtocol):
+    async def handle_websocket(self, websocket: 'ServerProtocol'):
         """Handle WebSocket connections"""
         self.broadcaster.add_client(websocket)
 
         try:
-            # Get actual screen dimensions from capture engine
-            screen_width = 1920
-            screen_height = 1080
-            
-            # If capture engine is initialized, get actual dimensions from the first monitor
-            if hasattr(self.capture_engine, 'monitors') and self.capture_engine.monitors:
-                try:
-                    first_monitor = self.capture_engine.monitors[0]
-                    screen_width = first_monitor.get('width', 1920) if isinstance(first_monitor, dict) else 1920
-                    screen_height = first_monitor.get('height', 1080) if isinstance(first_monitor, dict) else 1080
-                except (IndexError, AttributeError, KeyError):
-                    # Fallback to defaults if there's an issue accessing monitor dimensions
-                    screen_width = 1920
-                    screen_height = 1080
-
-            # Send screen size
-            await websocket.send(json.dumps({
-                "type": "screen_size",
-                "width": screen_width,
-                "height": screen_height
-            }))
+            # Unchanged frames are not rebroadcast, so seed new clients with the latest one
+            last_frame = self.capture_engine.last_frame
+            if last_frame:
+                await websocket.send(self.security.encrypt_data(last_frame))
+
+            # Bound once per connection; the message loop runs for every input batch
+            binary_handlers = self._binary_handlers
+            dispatch_command = self._dispatch_command
 
             async for message in websocket:
                 try:
                     if isinstance(message, bytes):
-                        # Handle binary messages (e.g., file uploads)
-                        if self.config.features.enable_file_transfer:
-                            await self._handle_file_transfer(websocket, message)
+                        # Binary messages: one kind byte, then the payload (pings, mouse records, files)
+                        handler = binary_handlers.get(message[0]) if message else None
+                        if handler is not None:
+                            await handler(websocket, memoryview(message)[1:])
                     else:
                         # Handle text messages (JSON commands)
-                        data = json.loads(message)
-                        
-                        # Handle different command types
-                        cmd_type = data.get('type', 'control')
-                        
-                        if cmd_type == 'control':
-                            # These are input control commands (mouse, keyboard, etc.)
-                            await self.input_controller.handle_command(data)
-                        elif cmd_type == 'command':
-                            # These are system commands (auto-click, settings, etc.)
-                            await self._handle_system_command(data)
-                        elif cmd_type == 'ping':
-                            # Respond to ping for latency measurement
-                            await websocket.send(json.dumps({"type": "pong"}))
+                        data = loads_json(message)
+
+                        if data.get('type') == 'batch':
+                            # Commands coalesced by the client into one message per animation frame
+                            for cmd in data.get('cmds', ()):
+                                await dispatch_command(websocket, cmd)
                         else:
-                            # Unknown command type
-                            logging.warning(f"Unknown command type: {cmd_type}")
+                            await dispatch_command(websocket, data)
                 except Exception as e:
-                    logging.error(f"WebSocket message error: {e}")
+                    logging.error("WebSocket message error: %s", e)
         except Exception as e:
-            logging.error(f"WebSocket error: {e}")
+            logging.error("WebSocket error: %s", e)
         finally:
             self.broadcaster.remove_client(websocket)
 
-    async def _handle_file_transfer(self, websocket: ServerProtocol, data: bytes):
-        """Handle file transfer data"""
-        try:
-            # Decrypt if needed
-            if self.security.cipher:
-                data = self.security.decrypt_data(data)
+    async def _dispatch_command(self, websocket: 'ServerProtocol', data: dict):
+        """Route a single decoded client command"""
+        cmd_type = data.get('type', 'control')
+
+        if cmd_type == 'control':
+            # These are input control commands (mouse, keyboard, etc.)
+            await self.input_controller.handle_command(data)
+        elif cmd_type == 'command':
+            # These are system commands (auto-click, settings, etc.)
+            await self._handle_system_command(data)
+        elif cmd_type == 'ping':
+            # Respond to ping for latency measurement
+            await websocket.send(PONG_MESSAGE)
+        else:
+            # Unknown command type
+            logging.warning("Unknown command type: %s", cmd_type)
 
-            # Decompress if needed
-            if self.config.performance.compression_level > 0:
-                data = zlib.decompress(data)
+    async def _handle_ping(self, websocket: 'ServerProtocol', payload: memoryview):
+        """Respond to a binary ping for latency measurement"""
+        await websocket.send(PONG_MESSAGE)
 
-            # Here you would process the file data
-            # For now, just log the file transfer
-            logging.info(f"Received file transfer data: {len(data)} bytes")
+    async def _handle_input_records(self, websocket: 'ServerProtocol', payload: memoryview):
+        """Apply packed mouse records; keys and settings stay JSON"""
+        self.input_controller.handle_records(payload)
+
+    async def _handle_file_transfer(self, websocket: 'ServerProtocol', data: memoryview):
+        """Handle file transfer data"""
+        try:
+            # Decrypt and inflate in the executor so large uploads do not stall the frame stream
+            size = await asyncio.get_running_loop().run_in_executor(None, self._unpack_file_transfer, bytes(data))
+            logging.info("Received file transfer data: %d bytes", size)
 
             # Send confirmation
-            await websocket.send(json.dumps({
+            await websocket.send(dumps_json_text({
                 "type": "file_transfer",
                 "status": "success",
-                "size": len(data)
+                "size": size
             }))
         except Exception as e:
-            logging.error(f"File transfer error: {e}")
-            await websocket.send(json.dumps({
+            logging.error("File transfer error: %s", e)
+            await websocket.send(dumps_json_text({
                 "type": "file_transfer",
                 "status": "error",
                 "message": str(e)
             }))
 
+    def _unpack_file_transfer(self, data: bytes) -> int:
+        """Decrypt and decompress a file transfer payload; returns the file size"""
+        # Decrypt if needed
+        if self.security.cipher:
+            data = self.security.decrypt_data(data)
+
+        # Uploads are always zlib, whatever compression_algo the server uses for its own output
+        if self.config.performance.compression_level <= 0:
+            return len(data)
+
+        # Inflate in bounded chunks so the whole decompressed file is never held in memory
+        decompressor = zlib.decompressobj()
+        size = 0
+        chunk = decompressor.decompress(data, FILE_CHUNK_SIZE)
+        while chunk:
+            # Here you would process the file data; for now only its size is recorded
+            size += len(chunk)
+            chunk = decompressor.decompress(decompressor.unconsumed_tail, FILE_CHUNK_SIZE)
+        size += len(decompressor.flush())
+        # Raised errors are reported to the client
+        if not decompressor.eof:
+            raise ValueError("Compressed payload is truncated or corrupt")
+        if decompressor.unused_data:
+            raise ValueError("Unexpected data after the compressed payload")
+        return size
+
     async def _handle_system_command(self, data: dict):
         """Handle system commands from the client"""
         try:
@@ -280,70 +399,112 @@ class RemoteDesktopServer:
                 # Trigger stop auto click in the input controller
                 await self.input_controller.handle_command({'action': 'stop_auto_click'})
             elif action == 'set_quality':
-                # Handle quality setting (would update performance config in a full implementation)
-                quality = data.get('quality', 75)
-                logging.info(f"Quality setting changed to: {quality}%")
+                # Sent by the quality slider and by the client's latency-driven adaptation
+                self.capture_engine.set_quality(data.get('quality', 75))
             elif action == 'set_fps':
-                # Handle FPS setting (would update performance config in a full implementation)
-                fps = data.get('fps', 30)
-                logging.info(f"FPS setting changed to: {fps}")
+                self.capture_engine.set_fps(data.get('fps', 30))
             else:
-                logging.warning(f"Unknown system command action: {action}")
+                logging.warning("Unknown system command action: %s", action)
         except Exception as e:
-            logging.error(f"System command handling error: {e}")
+            logging.error("System command handling error: %s", e)
 
     async def frame_broadcast_loop(self):
         """Main frame broadcasting loop"""
+        next_frame = self.capture_engine.next_frame
+        broadcast_frame = self.broadcaster.broadcast_frame
+        frames_dropped = self.broadcaster.metrics.frames_dropped
+        # The capture thread only counts drops; they are published to metrics from here
+        reported_drops = 0
+        backoff = FRAME_LOOP_BACKOFF_MIN
+
+        # Cancellation (shutdown) propagates; the try is only re-entered after an error
         while True:
             try:
-                # Get frame from queue
-                frame_data = self.capture_engine.frame_queue.get()
+                while True:
+                    # Wait for the next frame without blocking the event loop
+                    frame_data, thumb_data = await next_frame()
+
+                    # Broadcast to all clients (per-client send errors are handled inside)
+                    await broadcast_frame(frame_data, thumb_data)
 
-                # Broadcast to all clients
-                await self.broadcaster.broadcast_frame(frame_data)
+                    # Produce the thumbnail tier only while some client is falling behind
+                    self.capture_engine.want_thumbnail = self.broadcaster.backpressured
 
-                # Small delay to prevent busy loop
-                await asyncio.sleep(0.001)
+                    dropped = self.capture_engine.dropped_frames
+                    if dropped != reported_drops:
+                        frames_dropped.inc(dropped - reported_drops)
+                        reported_drops = dropped
+                    backoff = FRAME_LOOP_BACKOFF_MIN
             except Exception as e:
-                logging.error(f"Frame broadcast error: {e}")
-                await asyncio.sleep(0.1)
+                logging.error("Frame broadcast error: %s", e)
+                # Recover within a millisecond from a one-off error, back off if it repeats
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, FRAME_LOOP_BACKOFF_MAX)
+
+    # (attribute, label) pairs shown in the FEATURES section of the banner
+    BANNER_FEATURES = (
+        ("enable_audio", "Audio Streaming"),
+        ("enable_clipboard", "Clipboard Sync"),
+        ("enable_file_transfer", "File Transfer"),
+        ("enable_session_recording", "Session Recording"),
+        ("enable_multi_monitor", "Multi-Monitor"),
+    )
 
     def _print_server_info(self):
         """Print server information based on configuration"""
+        # Assembled first and written once, instead of one print call per line
+        sys.stdout.write(self._format_server_info())
+        sys.stdout.flush()
+
+    def _format_server_info(self) -> str:
+        """Build the startup banner text"""
+        from capture import compression_label
+
         server_config = self.config.server
         security_config = self.config.security
+        features = self.config.features
 
         protocol = "https" if security_config.enable_ssl else "http"
         ws_protocol = "wss" if security_config.enable_ssl else "ws"
-
-        print("\n" + "="*60)
-        print("  ENTERPRISE REMOTE DESKTOP SERVER")
-        print("="*60)
-        print(f"  Configuration: {self.config_manager.config_path}")
-        print(f"  Security: {'SSL Enabled' if security_config.enable_ssl else 'Standard'}")
-        print(f"  Max FPS: {self.config.performance.max_fps}")
-        print(f"  Compression: ZLIB Level {self.config.performance.compression_level}")
-        print("\n  SERVER ENDPOINTS:")
-        print(f"  Web Interface: {protocol}://{get_local_ip()}:{server_config.http_port}/")
-        print(f"  WebSocket: {ws_protocol}://{get_local_ip()}:{server_config.ws_port}/")
+        local_ip = get_local_ip()
+
+        lines = [
+            "",
+            "=" * 60,
+            "  ENTERPRISE REMOTE DESKTOP SERVER",
+            "=" * 60,
+            f"  Configuration: {self.config_manager.config_path}",
+            f"  Security: {'SSL Enabled' if security_config.enable_ssl else 'Standard'}",
+            f"  Max FPS: {self.config.performance.max_fps}",
+            f"  Compression: {compression_label(self.config.performance)}",
+            "",
+            "  SERVER ENDPOINTS:",
+            f"  Web Interface: {protocol}://{local_ip}:{server_config.http_port}/",
+            f"  WebSocket: {ws_protocol}://{local_ip}:{server_config.ws_port}/",
+        ]
         if server_config.metrics_port > 0:
-            print(f"  Metrics: http://{get_local_ip()}:{server_config.metrics_port}/")
-        print("\n  FEATURES:")
-        features = self.config.features
-        print(f"  • Audio Streaming: {'Enabled' if features.enable_audio else 'Disabled'}")
-        print(f"  • Clipboard Sync: {'Enabled' if features.enable_clipboard else 'Disabled'}")
-        print(f"  • File Transfer: {'Enabled' if features.enable_file_transfer else 'Disabled'}")
-        print(f"  • Session Recording: {'Enabled' if features.enable_session_recording else 'Disabled'}")
-        print(f"  • Multi-Monitor: {'Enabled' if features.enable_multi_monitor else 'Disabled'}")
-        print("\n  Press Ctrl+C to shutdown the server")
-        print("="*60 + "\n")
-
-    async def _cleanup(self, runner, ws_server):
+            lines.append(f"  Metrics: http://{local_ip}:{server_config.metrics_port}/")
+        lines += ["", "  FEATURES:"]
+        lines += [
+            f"  • {label}: {'Enabled' if getattr(features, name) else 'Disabled'}"
+            for name, label in self.BANNER_FEATURES
+        ]
+        lines += ["", "  Press Ctrl+C to shutdown the server", "=" * 60, "", ""]
+        return "\n".join(lines)
+
+    async def _cleanup(self, runner, ws_server, frame_task):
         """Cleanup resources"""
+        # Stop the broadcaster before the capture thread it waits on
+        frame_task.cancel()
+        try:
+            await frame_task
+        except asyncio.CancelledError:
+            pass
         self.capture_engine.stop_capture()
         await runner.cleanup()
         ws_server.close()
         logging.info("Server shutdown complete")
+        self._log_listener.stop()
 
 
 def main():
@@ -374,6 +535,8 @@ def main():
 
     # Handle port killing
     if args.kill_port:
+        # Plain console output for the PID/error details kill_process_on_port logs
+        logging.basicConfig(level=logging.INFO, format='%(message)s')
         if kill_process_on_port(args.kill_port):
             print(f"Successfully killed process using port {args.kill_port}")
         else:
@@ -397,6 +560,8 @@ def main():
     # Start the server
     try:
         server = RemoteDesktopServer(args.config)
+        if UVLOOP_AVAILABLE:
+            uvloop.install()
         asyncio.run(server.start())
     except Exception as e:
         print(f"Error starting server: {e}")
@@ -1,13 +1,59 @@
 """
 Utility functions for the remote desktop system
 """
+import functools
+import json
+import logging
+import re
 import socket
 import os
-from typing import Optional
+from typing import Any, Optional, Union
 
+# orjson is optional; fall back to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
+# psutil is optional; without it port owners are found with netstat/lsof
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
+# A listening TCP row of `netstat -ano`: local port and owning PID. Matched on raw bytes
+# so the output is never decoded with the console code page
+_NETSTAT_LISTEN_RE = re.compile(rb"^\s*TCP\s+\S+:(\d+)\s+\S+\s+LISTENING\s+(\d+)\s*$")
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def dumps_json_text(obj: Any) -> str:
+    """Serialize an object to compact JSON text (sent as a WebSocket text message)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON from str or UTF-8 bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=1)
 def get_local_ip() -> str:
-    """Get local IP address"""
+    """Get local IP address (looked up once; see invalidate_local_ip)"""
     s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     try:
         s.connect(("8.8.8.8", 1))
@@ -19,17 +65,42 @@ def get_local_ip() -> str:
     return ip
 
 
+def invalidate_local_ip():
+    """Forget the cached local IP, e.g. after the host changes networks"""
+    get_local_ip.cache_clear()
+
+
 def is_port_available(host: str, port: int) -> bool:
     """Check if a port is available for binding"""
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if os.name == 'posix':
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            else:
+                # On Windows SO_REUSEADDR would let the probe bind a port another process is
+                # listening on; exclusive use makes that bind fail as it should
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
             s.bind((host, port))
             return True
     except OSError:
         return False
 
 
+def bind_tcp_socket(host: str, port: int) -> Optional[socket.socket]:
+    """Bind a TCP socket for a server to listen on, or return None if the port is taken"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        # Same policy as asyncio's create_server: on POSIX, TIME_WAIT leftovers do not block
+        # a restart; on Windows SO_REUSEADDR would let two live servers share the port
+        if os.name == 'posix':
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        return sock
+    except OSError:
+        sock.close()
+        return None
+
+
 def find_available_port(host: str, start_port: int, end_port: int) -> Optional[int]:
     """Find an available port in the given range"""
     for port in range(start_port, end_port + 1):
@@ -38,60 +109,74 @@ def find_available_port(host: str, start_port: int, end_port: int) -> Optional[i
     return None
 
 
+def _kill_with_psutil(port: int) -> Optional[bool]:
+    """Kill the listener on a port via psutil; None if its connection table is not readable"""
+    try:
+        connections = psutil.net_connections(kind='tcp')
+    except psutil.AccessDenied:
+        # macOS needs root to list other users' sockets; fall back to the system tools
+        return None
+
+    for conn in connections:
+        if conn.status == psutil.CONN_LISTEN and conn.laddr and conn.laddr.port == port and conn.pid:
+            try:
+                psutil.Process(conn.pid).kill()
+                logging.info("Killed process with PID %d using port %d", conn.pid, port)
+                return True
+            except psutil.Error:
+                pass
+    return False
+
+
 def kill_process_on_port(port: int) -> bool:
-    """Kill the process using the specified port (Cross-platform)"""
+    """Kill the process listening on the specified port (Cross-platform)"""
     import platform
     try:
         import subprocess
-        
+
+        if PSUTIL_AVAILABLE:
+            killed = _kill_with_psutil(port)
+            if killed is not None:
+                return killed
+
         system = platform.system().lower()
         
         if system == "windows":
             # Windows implementation
-            result = subprocess.run(
-                ["netstat", "-ano"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
-            # Parse the result to find the PID
-            for line in result.stdout.split('\n'):
-                if f":{port}" in line and "LISTENING" in line:
-                    parts = line.strip().split()
-                    if len(parts) >= 5:
-                        pid = parts[-1]
-                        try:
-                            # Kill the process
-                            subprocess.run(["taskkill", "/F", "/PID", pid], check=True)
-                            print(f"Killed process with PID {pid} using port {port}")
-                            return True
-                        except subprocess.CalledProcessError:
-                            pass
+            # Read line by line so the scan stops at the listener instead of buffering the whole table
+            with subprocess.Popen(["netstat", "-ano"], stdout=subprocess.PIPE) as netstat:
+                try:
+                    for line in netstat.stdout:
+                        # The exact port match avoids :80 matching :8080
+                        match = _NETSTAT_LISTEN_RE.match(line)
+                        if match and int(match.group(1)) == port:
+                            pid = match.group(2).decode('ascii')
+                            try:
+                                # Kill the process
+                                subprocess.run(["taskkill", "/F", "/PID", pid], check=True)
+                                logging.info("Killed process with PID %s using port %d", pid, port)
+                                return True
+                            except subprocess.CalledProcessError:
+                                pass
+                finally:
+                    # Stop netstat if we returned before it finished printing
+                    netstat.kill()
         else:
-            # Unix-like systems (Linux/Mac) implementation
+            # Unix-like systems (Linux/Mac) implementation: -t prints bare PIDs of listeners only
             result = subprocess.run(
-                ["lsof", "-i", f":{port}"],
+                ["lsof", "-t", "-sTCP:LISTEN", "-i", f"TCP:{port}"],
                 capture_output=True,
                 text=True
             )
             
-            if result.returncode == 0 and result.stdout:
-                # Extract PID from lsof output (skip header line)
-                lines = result.stdout.strip().split('\n')[1:]
-                for line in lines:
-                    if line:
-                        # First column is the process name, second is PID
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            pid = parts[1]  # PID is in the second column
-                            try:
-                                subprocess.run(["kill", "-9", pid], check=True)
-                                print(f"Killed process with PID {pid} using port {port}")
-                                return True
-                            except subprocess.CalledProcessError:
-                                pass
+            for pid in result.stdout.split():
+                try:
+                    subprocess.run(["kill", "-9", pid], check=True)
+                    logging.info("Killed process with PID %s using port %d", pid, port)
+                    return True
+                except subprocess.CalledProcessError:
+                    pass
         return False
     except Exception as e:
-        print(f"Error killing process on port {port}: {e}")
-        return False
\ No newline at end of file
+        logging.error("Error killing process on port %d: %s", port, e)
+        return False
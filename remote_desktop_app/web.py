@@ -1,155 +1,685 @@
 """
 Web interface for the remote desktop system
 """
+import asyncio
+import functools
+import gzip
+import hashlib
 import json
+import mimetypes
 import os
+import stat
+from typing import Dict, Optional, Tuple
 from aiohttp import web
-from aiohttp.web import Application, Response
+from aiohttp.web import Application, FileResponse, Response
 from models import SystemConfig
 
+# brotli is optional; browsers that accept it get a smaller page than gzip
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+
+# Stylesheet and script for the page, served from content-hashed /static/ URLs so
+# browsers cache them independently of the page shell
+_APP_CSS = """
+:root {
+    --primary-color: #2c3e50;
+    --secondary-color: #3498db;
+    --success-color: #27ae60;
+    --danger-color: #e74c3c;
+    --dark-color: #1a1a1a;
+}
+
+body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    background-color: #f5f5f5;
+    overflow: hidden;
+}
+
+.main-header {
+    background: linear-gradient(135deg, var(--primary-color), var(--secondary-color));
+    color: white;
+    padding: 1rem;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+
+.screen-container {
+    position: relative;
+    background-color: var(--dark-color);
+    overflow: hidden;
+    height: calc(100vh - 120px);
+}
+
+#screen {
+    display: block;
+    max-width: 100%;
+    max-height: 100%;
+    object-fit: contain;
+    cursor: crosshair;
+}
+
+.control-panel {
+    background: white;
+    border-radius: 10px;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    padding: 1.5rem;
+    height: calc(100vh - 140px);
+    overflow-y: auto;
+}
+
+.icon {
+    width: 1em;
+    height: 1em;
+    vertical-align: -0.125em;
+    fill: none;
+    stroke: currentColor;
+    stroke-width: 2;
+    stroke-linecap: round;
+    stroke-linejoin: round;
+}
+
+/* The auto-click button shows the icon matching its current state */
+#auto-click-btn.btn-success .icon-stop,
+#auto-click-btn.btn-danger .icon-robot {
+    display: none;
+}
+
+.status-indicator {
+    display: inline-block;
+    width: 12px;
+    height: 12px;
+    border-radius: 50%;
+    margin-right: 8px;
+}
+
+.status-connected {
+    background-color: var(--success-color);
+    box-shadow: 0 0 10px var(--success-color);
+}
+
+.status-disconnected {
+    background-color: var(--danger-color);
+}
+
+.log-container {
+    background-color: #2c3e50;
+    color: #ecf0f1;
+    border-radius: 8px;
+    padding: 1rem;
+    height: 200px;
+    overflow-y: auto;
+    font-family: 'Courier New', monospace;
+    font-size: 0.85rem;
+}
+
+.log-entry {
+    margin-bottom: 0.5rem;
+    padding: 0.25rem;
+    border-left: 3px solid transparent;
+}
+
+.log-entry.key { border-left-color: var(--success-color); }
+.log-entry.click { border-left-color: var(--secondary-color); }
+.log-entry.scroll { border-left-color: #9b59b6; }
+.log-entry.move { border-left-color: #f39c12; }
+.log-entry.system { border-left-color: #95a5a6; }
+
+.metric-card {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    border-radius: 10px;
+    padding: 1rem;
+    margin-bottom: 1rem;
+}
+
+.btn-custom {
+    border-radius: 25px;
+    padding: 0.5rem 1.5rem;
+    font-weight: 500;
+    transition: all 0.3s ease;
+}
+
+.btn-custom:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+}
+
+.quality-slider {
+    width: 100%;
+}
+
+@media (max-width: 768px) {
+    .control-panel {
+        height: auto;
+        max-height: 300px;
+    }
+}
+"""
 
-class WebInterface:
-    """Enterprise-grade web interface with responsive design"""
-    def __init__(self, config: SystemConfig):
-        self.config = config
-        self.html_content = self._generate_html()
 
-    def _generate_html(self) -> str:
-        """Generate responsive HTML interface"""
-        # Get the WebSocket port from the configuration
-        ws_port = self.config.server.ws_port
-        return f"""
+_APP_JS = """
+// Enterprise-grade JavaScript implementation
+
+// Binary messages start with a kind byte (see MSG_* in server.py); mouse commands
+// travel as packed records (see INPUT_RECORD in controller.py)
+const MSG_PING = 0x00;
+const MSG_INPUT = 0x01;
+const PING_MESSAGE = new Uint8Array([MSG_PING]);
+const INPUT_OPS = { move: 1, click: 2, double_click: 3, scroll: 4 };
+const INPUT_BUTTONS = { left: 0, right: 1, middle: 2 };
+const INPUT_RECORD_SIZE = 8;
+
+class RemoteDesktopClient {
+    constructor() {
+        this.ws = null;
+        this.connected = false;
+        this.screenWidth = 1920;
+        this.screenHeight = 1080;
+        this.frameSeq = 0;
+        this.lastPingTime = 0;
+        this.autoClickActive = false;
+        this.pendingCmds = [];
+        this.flushScheduled = false;
+        this.pendingMove = null;
+        this.latestFrame = null;
+        this.frameRafPending = false;
+        this.logRing = new Array(100);
+        this.logHead = 0;
+        this.logCount = 0;
+        this.logDirty = false;
+        this.undecodableWarned = false;
+        this.wsPort = Number(document.body.dataset.wsPort); // Configured WebSocket port, set on <body> by the page
+        // Latency-driven quality adaptation: EMA of ping RTT and consecutive-sample counters
+        this.rttEma = 0;
+        this.slowSamples = 0;
+        this.fastSamples = 0;
+        this.initializeComponents();
+        // User selections are the ceiling; adaptation only steps below them
+        this.targetQuality = this.abrQuality = parseInt(this.qualitySlider.value);
+        this.targetFps = this.abrFps = parseInt(this.fpsSelect.value);
+        this.setupEventListeners();
+        this.connectWebSocket();
+    }
+
+    initializeComponents() {
+        this.screenCanvas = document.getElementById('screen');
+        this.screenCtx = this.screenCanvas.getContext('bitmaprenderer');
+        this.screenRect = null;
+        this.connectionStatus = document.getElementById('connection-status');
+        this.statusIndicator = document.getElementById('status-indicator');
+        this.latencyInfo = document.getElementById('latency-info');
+        this.eventLog = document.getElementById('event-log');
+        this.qualitySlider = document.getElementById('quality-slider');
+        this.qualityValue = document.getElementById('quality-value');
+        this.fpsSelect = document.getElementById('fps-select');
+    }
+
+    setupEventListeners() {
+        // Screen interactions
+        this.screenCanvas.addEventListener('contextmenu', e => e.preventDefault());
+        this.screenCanvas.addEventListener('mousedown', this.handleMouseDown.bind(this));
+        this.screenCanvas.addEventListener('dblclick', this.handleDoubleClick.bind(this));
+        this.screenCanvas.addEventListener('mousemove', this.handleMouseMove.bind(this), { passive: true });
+        this.screenCanvas.addEventListener('wheel', this.handleWheel.bind(this));
+
+        // The cached screen rect is only stale after layout moves or resizes the canvas
+        const invalidateRect = () => { this.screenRect = null; };
+        window.addEventListener('resize', invalidateRect, { passive: true });
+        window.addEventListener('scroll', invalidateRect, { passive: true, capture: true });
+
+        // Keyboard events
+        document.addEventListener('keydown', this.handleKeyDown.bind(this));
+
+        // Control buttons
+        document.getElementById('left-click-btn').addEventListener('click', () => this.sendClick('left'));
+        document.getElementById('right-click-btn').addEventListener('click', () => this.sendClick('right'));
+        document.getElementById('auto-click-btn').addEventListener('click', this.toggleAutoClick.bind(this));
+        document.getElementById('reconnect-btn').addEventListener('click', () => this.connectWebSocket());
+
+        // Performance controls
+        this.qualitySlider.addEventListener('input', this.updateQuality.bind(this));
+        this.fpsSelect.addEventListener('change', this.updateFPS.bind(this));
+    }
+
+    connectWebSocket() {
+        const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+        const wsUrl = `${protocol}//${window.location.hostname}:${this.wsPort}`;
+
+        this.ws = new WebSocket(wsUrl);
+        this.ws.binaryType = 'arraybuffer';
+
+        this.ws.onopen = () => {
+            this.connected = true;
+            this.updateConnectionStatus('Connected', true);
+            this.startLatencyCheck();
+        };
+
+        this.ws.onmessage = (event) => {
+            if (event.data instanceof ArrayBuffer) {
+                this.handleFrameData(event.data);
+            } else {
+                this.handleJsonMessage(JSON.parse(event.data));
+            }
+        };
+
+        this.ws.onclose = () => {
+            this.connected = false;
+            this.updateConnectionStatus('Disconnected', false);
+            setTimeout(() => this.connectWebSocket(), 2000);
+        };
+
+        this.ws.onerror = (error) => {
+            console.error('WebSocket Error:', error);
+        };
+    }
+
+    handleFrameData(arrayBuffer) {
+        // 16-byte little-endian header: screen width, height, sequence, capture time (us)
+        const header = new DataView(arrayBuffer);
+        if (arrayBuffer.byteLength < 18 || header.getUint16(16) !== 0xFFD8) {
+            // Not a frame: an event batch the server compressed (compress_events) or encrypted,
+            // which this client cannot read. Say so once instead of dropping events silently
+            this.warnUndecodable();
+            return;
+        }
+        this.screenWidth = header.getUint32(0, true);
+        this.screenHeight = header.getUint32(4, true);
+        this.frameSeq = header.getUint32(8, true);
+
+        // Only the newest frame is kept; older undecoded frames are simply dropped
+        this.latestFrame = new Uint8Array(arrayBuffer, 16);
+
+        if (!this.frameRafPending) {
+            this.frameRafPending = true;
+            requestAnimationFrame(() => this.renderLatestFrame());
+        }
+    }
+
+    async renderLatestFrame() {
+        const buf = this.latestFrame;
+        this.latestFrame = null;
+
+        try {
+            // Decoded off the main thread; no object URL to create or revoke
+            const bmp = await createImageBitmap(new Blob([buf], { type: 'image/jpeg' }));
+            if (this.screenCanvas.width !== bmp.width || this.screenCanvas.height !== bmp.height) {
+                this.screenCanvas.width = bmp.width;
+                this.screenCanvas.height = bmp.height;
+                this.screenRect = null;
+            }
+            this.screenCtx.transferFromImageBitmap(bmp);
+        } catch (error) {
+            console.error('Frame decode error:', error);
+        }
+
+        // A newer frame may have arrived while this one was decoding
+        if (this.latestFrame) {
+            requestAnimationFrame(() => this.renderLatestFrame());
+        } else {
+            this.frameRafPending = false;
+        }
+    }
+
+    warnUndecodable() {
+        if (this.undecodableWarned) {
+            return;
+        }
+        this.undecodableWarned = true;
+        this.addLogEntry({
+            timestamp: new Date().toLocaleTimeString(),
+            type: 'system',
+            details: 'Event batches are compressed or encrypted and cannot be shown; disable compress_events to see them'
+        });
+    }
+
+    handleJsonMessage(data) {
+        if (data.type === 'pong') {
+            const latency = Math.round(performance.now() - this.lastPingTime);
+            this.latencyInfo.textContent = latency;
+            this.adaptQuality(latency);
+        } else if (Array.isArray(data)) {
+            // Events flushed together by the server arrive as one array
+            data.forEach(event => this.addLogEntry(event));
+        } else {
+            this.addLogEntry(data);
+        }
+    }
+
+    handleMouseDown(e) {
+        e.preventDefault();
+        const coords = this.getScreenCoordinates(e);
+        const button = e.button === 0 ? 'left' : 'right';
+
+        this.sendCommand({
+            type: 'control',
+            action: 'click',
+            x: coords.x,
+            y: coords.y,
+            button: button
+        });
+    }
+
+    handleDoubleClick(e) {
+        e.preventDefault();
+        const coords = this.getScreenCoordinates(e);
+
+        this.sendCommand({
+            type: 'control',
+            action: 'double_click',
+            x: coords.x,
+            y: coords.y
+        });
+    }
+
+    handleMouseMove(e) {
+        // Keep only the latest event; it is mapped to screen coordinates once, at the next command flush
+        this.pendingMove = e;
+        this.scheduleFlush();
+    }
+
+    handleWheel(e) {
+        e.preventDefault();
+        const coords = this.getScreenCoordinates(e);
+        const deltaY = e.deltaY > 0 ? 1 : -1;
+
+        this.sendCommand({
+            type: 'control',
+            action: 'scroll',
+            x: coords.x,
+            y: coords.y,
+            dy: deltaY
+        });
+    }
+
+    handleKeyDown(e) {
+        if (e.key.toLowerCase() === 'end') {
+            e.preventDefault();
+            return;
+        }
+
+        this.sendCommand({
+            type: 'control',
+            action: 'key',
+            key: e.key
+        });
+    }
+
+    getScreenCoordinates(e) {
+        // Cached so mousemove does not force a layout flush
+        const rect = this.screenRect || (this.screenRect = this.screenCanvas.getBoundingClientRect());
+        const scaleX = this.screenWidth / rect.width;
+        const scaleY = this.screenHeight / rect.height;
+
+        return {
+            x: Math.round((e.clientX - rect.left) * scaleX),
+            y: Math.round((e.clientY - rect.top) * scaleY)
+        };
+    }
+
+    sendCommand(command) {
+        if (!this.connected) {
+            return;
+        }
+        // Ping bypasses the queue so latency reflects the network, not the paint rhythm
+        if (command.type === 'ping') {
+            this.ws.send(PING_MESSAGE);
+            return;
+        }
+
+        // Queue and flush once per animation frame as a single batch message. A coalesced move
+        // goes first so a click in the same frame lands at the latest position
+        this.queuePendingMove();
+        this.pendingCmds.push(command);
+        this.scheduleFlush();
+    }
+
+    scheduleFlush() {
+        if (!this.flushScheduled) {
+            this.flushScheduled = true;
+            requestAnimationFrame(() => this.flushCommands());
+        }
+    }
+
+    queuePendingMove() {
+        if (this.pendingMove) {
+            const coords = this.getScreenCoordinates(this.pendingMove);
+            this.pendingCmds.push({
+                type: 'control',
+                action: 'move',
+                x: coords.x,
+                y: coords.y
+            });
+            this.pendingMove = null;
+        }
+    }
+
+    flushCommands() {
+        this.flushScheduled = false;
+        this.queuePendingMove();
+        if (!this.pendingCmds.length) {
+            return;
+        }
+        if (this.connected) {
+            const records = [];
+            const cmds = [];
+            for (const cmd of this.pendingCmds) {
+                (cmd.type === 'control' && cmd.action in INPUT_OPS ? records : cmds).push(cmd);
+            }
+            if (records.length) {
+                this.ws.send(this.packInputRecords(records));
+            }
+            if (cmds.length) {
+                this.ws.send(JSON.stringify(cmds.length === 1 ? cmds[0] : { type: 'batch', cmds: cmds }));
+            }
+        }
+        this.pendingCmds = [];
+    }
+
+    packInputRecords(cmds) {
+        // Message-kind byte, then per command: opcode, button, x, y, dy (little-endian)
+        const view = new DataView(new ArrayBuffer(1 + cmds.length * INPUT_RECORD_SIZE));
+        view.setUint8(0, MSG_INPUT);
+        cmds.forEach((cmd, i) => {
+            const offset = 1 + i * INPUT_RECORD_SIZE;
+            view.setUint8(offset, INPUT_OPS[cmd.action]);
+            view.setUint8(offset + 1, INPUT_BUTTONS[cmd.button] || 0);
+            view.setInt16(offset + 2, cmd.x || 0, true);
+            view.setInt16(offset + 4, cmd.y || 0, true);
+            view.setInt16(offset + 6, cmd.dy || 0, true);
+        });
+        return view.buffer;
+    }
+
+    sendClick(button) {
+        this.sendCommand({
+            type: 'control',
+            action: 'click',
+            button: button
+        });
+    }
+
+    toggleAutoClick() {
+        this.autoClickActive = !this.autoClickActive;
+        const btn = document.getElementById('auto-click-btn');
+        const label = document.getElementById('auto-click-label');
+
+        if (this.autoClickActive) {
+            btn.classList.remove('btn-success');
+            btn.classList.add('btn-danger');
+            label.textContent = 'Stop Auto Click';
+            this.sendCommand({ type: 'command', action: 'start_auto_click' });
+        } else {
+            btn.classList.remove('btn-danger');
+            btn.classList.add('btn-success');
+            label.textContent = 'Auto Click';
+            this.sendCommand({ type: 'command', action: 'stop_auto_click' });
+        }
+    }
+
+    updateQuality() {
+        const quality = this.qualitySlider.value;
+        this.qualityValue.textContent = quality + '%';
+        this.targetQuality = this.abrQuality = parseInt(quality);
+        this.sendCommand({
+            type: 'command',
+            action: 'set_quality',
+            quality: parseInt(quality)
+        });
+    }
+
+    updateFPS() {
+        const fps = this.fpsSelect.value;
+        this.targetFps = this.abrFps = parseInt(fps);
+        this.sendCommand({
+            type: 'command',
+            action: 'set_fps',
+            fps: parseInt(fps)
+        });
+    }
+
+    adaptQuality(rtt) {
+        this.rttEma = this.rttEma ? this.rttEma * 0.7 + rtt * 0.3 : rtt;
+
+        if (this.rttEma > 120) {
+            // Congested: step quality down and cap FPS until latency recovers
+            this.fastSamples = 0;
+            if (++this.slowSamples >= 3) {
+                this.slowSamples = 0;
+                this.applyAdaptiveSettings(
+                    Math.min(this.abrQuality, Math.max(30, this.abrQuality - 10)),
+                    Math.min(15, this.targetFps)
+                );
+            }
+        } else if (this.rttEma < 60) {
+            // Recovered: step back up towards the user's selection
+            this.slowSamples = 0;
+            if (++this.fastSamples >= 3) {
+                this.fastSamples = 0;
+                this.applyAdaptiveSettings(
+                    Math.min(this.targetQuality, this.abrQuality + 10),
+                    this.targetFps
+                );
+            }
+        } else {
+            this.slowSamples = this.fastSamples = 0;
+        }
+    }
+
+    applyAdaptiveSettings(quality, fps) {
+        if (quality !== this.abrQuality) {
+            this.abrQuality = quality;
+            this.sendCommand({ type: 'command', action: 'set_quality', quality: quality });
+        }
+        if (fps !== this.abrFps) {
+            this.abrFps = fps;
+            this.sendCommand({ type: 'command', action: 'set_fps', fps: fps });
+        }
+    }
+
+    updateConnectionStatus(status, connected) {
+        this.connectionStatus.textContent = status;
+        this.statusIndicator.className = `status-indicator ${connected ? 'status-connected' : 'status-disconnected'}`;
+    }
+
+    addLogEntry(data) {
+        // Write into a fixed-size ring; the DOM is rebuilt at most once per animation frame
+        this.logRing[this.logHead] = {
+            className: `log-entry ${data.type}`,
+            text: `[${data.timestamp}] ${data.type.toUpperCase()}: ${JSON.stringify(data.details)}`
+        };
+        this.logHead = (this.logHead + 1) % this.logRing.length;
+        this.logCount = Math.min(this.logCount + 1, this.logRing.length);
+
+        if (!this.logDirty) {
+            this.logDirty = true;
+            requestAnimationFrame(() => this.renderLog());
+        }
+    }
+
+    renderLog() {
+        this.logDirty = false;
+        const size = this.logRing.length;
+        const frag = document.createDocumentFragment();
+
+        // Oldest to newest
+        for (let i = this.logCount; i > 0; i--) {
+            const item = this.logRing[(this.logHead - i + size) % size];
+            const entry = document.createElement('div');
+            entry.className = item.className;
+            entry.textContent = item.text;
+            frag.appendChild(entry);
+        }
+
+        this.eventLog.replaceChildren(frag);
+        this.eventLog.scrollTop = this.eventLog.scrollHeight;
+    }
+
+    startLatencyCheck() {
+        setInterval(() => {
+            if (this.connected) {
+                this.lastPingTime = performance.now();
+                this.sendCommand({ type: 'ping' });
+            }
+        }, 2000);
+    }
+}
+
+// Initialize the application
+document.addEventListener('DOMContentLoaded', () => {
+    new RemoteDesktopClient();
+});
+"""
+
+
+# Inline SVG icons (24x24, stroked with the text colour by the .icon rule) in place of an icon font
+_ICON_PATHS = {
+    'desktop': '<rect x="2" y="3" width="20" height="14" rx="2"/><path d="M8 21h8M12 17v4"/>',
+    'network': '<rect x="9" y="2" width="6" height="6"/><rect x="2" y="16" width="6" height="6"/>'
+               '<rect x="16" y="16" width="6" height="6"/><path d="M12 8v4M5 16v-4h14v4"/>',
+    'refresh': '<path d="M23 4v6h-6M1 20v-6h6"/>'
+               '<path d="M3.51 9a9 9 0 0 1 14.85-3.36L23 10M1 14l4.64 4.36A9 9 0 0 0 20.49 15"/>',
+    'gauge': '<path d="M12 14l4-4"/><path d="M3.34 19a10 10 0 1 1 17.32 0"/>',
+    'pointer': '<path d="M3 3l7.07 16.97 2.51-7.39 7.39-2.51L3 3z"/><path d="M13 13l6 6"/>',
+    'robot': '<rect x="3" y="11" width="18" height="10" rx="2"/><circle cx="12" cy="5" r="2"/>'
+             '<path d="M12 7v4M8 16h.01M16 16h.01"/>',
+    'stop': '<rect x="5" y="5" width="14" height="14" rx="1"/>',
+    'list': '<path d="M8 6h13M8 12h13M8 18h13M3 6h.01M3 12h.01M3 18h.01"/>',
+}
+
+# Template substitutions {icon_<name>}; every icon but the icon-only refresh button is followed by a label
+_ICON_MARKUP = {
+    f'icon_{name}': f'<svg class="icon icon-{name}{"" if name == "refresh" else " me-2"}" viewBox="0 0 24 24" '
+                    f'aria-hidden="true">{paths}</svg>'
+    for name, paths in _ICON_PATHS.items()
+}
+
+# Page shell, built once at import. {ws_port}, {css_url}, {js_url} and the {icon_*}
+# markup are the only substitutions
+_HTML_TEMPLATE = """
         <!DOCTYPE html>
         <html lang="en">
         <head>
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
             <title>Enterprise Remote Desktop</title>
-            <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
-            <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-            <style>
-                :root {{
-                    --primary-color: #2c3e50;
-                    --secondary-color: #3498db;
-                    --success-color: #27ae60;
-                    --danger-color: #e74c3c;
-                    --dark-color: #1a1a1a;
-                }}
-                
-                body {{
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    background-color: #f5f5f5;
-                    overflow: hidden;
-                }}
-                
-                .main-header {{
-                    background: linear-gradient(135deg, var(--primary-color), var(--secondary-color));
-                    color: white;
-                    padding: 1rem;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                }}
-                
-                .screen-container {{
-                    position: relative;
-                    background-color: var(--dark-color);
-                    overflow: hidden;
-                    height: calc(100vh - 120px);
-                }}
-                
-                #screen {{
-                    max-width: 100%;
-                    max-height: 100%;
-                    object-fit: contain;
-                    cursor: crosshair;
-                }}
-                
-                .control-panel {{
-                    background: white;
-                    border-radius: 10px;
-                    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-                    padding: 1.5rem;
-                    height: calc(100vh - 140px);
-                    overflow-y: auto;
-                }}
-                
-                .status-indicator {{
-                    display: inline-block;
-                    width: 12px;
-                    height: 12px;
-                    border-radius: 50%;
-                    margin-right: 8px;
-                }}
-                
-                .status-connected {{
-                    background-color: var(--success-color);
-                    box-shadow: 0 0 10px var(--success-color);
-                }}
-                
-                .status-disconnected {{
-                    background-color: var(--danger-color);
-                }}
-                
-                .log-container {{
-                    background-color: #2c3e50;
-                    color: #ecf0f1;
-                    border-radius: 8px;
-                    padding: 1rem;
-                    height: 200px;
-                    overflow-y: auto;
-                    font-family: 'Courier New', monospace;
-                    font-size: 0.85rem;
-                }}
-                
-                .log-entry {{
-                    margin-bottom: 0.5rem;
-                    padding: 0.25rem;
-                    border-left: 3px solid transparent;
-                }}
-                
-                .log-entry.key {{ border-left-color: var(--success-color); }}
-                .log-entry.click {{ border-left-color: var(--secondary-color); }}
-                .log-entry.scroll {{ border-left-color: #9b59b6; }}
-                .log-entry.move {{ border-left-color: #f39c12; }}
-                .log-entry.system {{ border-left-color: #95a5a6; }}
-                
-                .metric-card {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    border-radius: 10px;
-                    padding: 1rem;
-                    margin-bottom: 1rem;
-                }}
-                
-                .btn-custom {{
-                    border-radius: 25px;
-                    padding: 0.5rem 1.5rem;
-                    font-weight: 500;
-                    transition: all 0.3s ease;
-                }}
-                
-                .btn-custom:hover {{
-                    transform: translateY(-2px);
-                    box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-                }}
-                
-                .quality-slider {{
-                    width: 100%;
-                }}
-                
-                @media (max-width: 768px) {{
-                    .control-panel {{
-                        height: auto;
-                        max-height: 300px;
-                    }}
-                }}
-            </style>
+            <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin>
+            <!-- The CDN stylesheet loads without blocking first paint; the app stylesheet below covers the page chrome -->
+            <link rel="preload" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" as="style" onload="this.onload=null;this.rel='stylesheet'">
+            <noscript>
+                <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css">
+            </noscript>
+            <link rel="stylesheet" href="{css_url}">
         </head>
-        <body>
+        <body data-ws-port="{ws_port}">
             <div class="main-header">
                 <div class="container-fluid">
                     <div class="row align-items-center">
                         <div class="col-md-6">
-                            <h1 class="h3 mb-0"><i class="fas fa-desktop me-2"></i>Enterprise Remote Desktop</h1>
+                            <h1 class="h3 mb-0">{icon_desktop}Enterprise Remote Desktop</h1>
                         </div>
                         <div class="col-md-6 text-end">
                             <div class="d-inline-block me-3">
@@ -168,25 +698,25 @@ class WebInterface:
                 <div class="row">
                     <div class="col-lg-9">
                         <div class="screen-container">
-                            <img id="screen" src="" alt="Remote Screen">
+                            <canvas id="screen" aria-label="Remote Screen"></canvas>
                         </div>
                     </div>
                     <div class="col-lg-3">
                         <div class="control-panel">
                             <!-- Connection Status -->
                             <div class="metric-card">
-                                <h5><i class="fas fa-network-wired me-2"></i>Connection Status</h5>
+                                <h5>{icon_network}Connection Status</h5>
                                 <div class="d-flex justify-content-between align-items-center">
                                     <span id="connection-detail">Not Connected</span>
-                                    <button class="btn btn-light btn-sm" id="reconnect-btn">
-                                        <i class="fas fa-sync-alt"></i>
+                                    <button class="btn btn-light btn-sm" id="reconnect-btn" aria-label="Reconnect">
+                                        {icon_refresh}
                                     </button>
                                 </div>
                             </div>
                             
                             <!-- Performance Metrics -->
                             <div class="mb-4">
-                                <h5><i class="fas fa-tachometer-alt me-2"></i>Performance</h5>
+                                <h5>{icon_gauge}Performance</h5>
                                 <div class="mb-3">
                                     <label class="form-label">Image Quality</label>
                                     <input type="range" class="form-range quality-slider" id="quality-slider" 
@@ -209,23 +739,23 @@ class WebInterface:
                             
                             <!-- Controls -->
                             <div class="mb-4">
-                                <h5><i class="fas fa-mouse-pointer me-2"></i>Controls</h5>
+                                <h5>{icon_pointer}Controls</h5>
                                 <div class="d-grid gap-2">
                                     <button class="btn btn-primary btn-custom" id="left-click-btn">
-                                        <i class="fas fa-mouse-pointer me-2"></i>Left Click
+                                        {icon_pointer}Left Click
                                     </button>
                                     <button class="btn btn-secondary btn-custom" id="right-click-btn">
-                                        <i class="fas fa-mouse-pointer me-2"></i>Right Click
+                                        {icon_pointer}Right Click
                                     </button>
                                     <button class="btn btn-success btn-custom" id="auto-click-btn">
-                                        <i class="fas fa-robot me-2"></i>Auto Click
+                                        {icon_robot}{icon_stop}<span id="auto-click-label">Auto Click</span>
                                     </button>
                                 </div>
                             </div>
                             
                             <!-- Event Log -->
                             <div>
-                                <h5><i class="fas fa-list me-2"></i>Event Log</h5>
+                                <h5>{icon_list}Event Log</h5>
                                 <div class="log-container" id="event-log">
                                     <div class="log-entry system">System initialized...</div>
                                 </div>
@@ -236,304 +766,160 @@ class WebInterface:
             </div>
             
             <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-            <script>
-                // Enterprise-grade JavaScript implementation
-                class RemoteDesktopClient {{
-                    constructor() {{
-                        this.ws = null;
-                        this.connected = false;
-                        this.screenWidth = 1920;
-                        this.screenHeight = 1080;
-                        this.lastPingTime = 0;
-                        this.autoClickActive = false;
-                        this.wsPort = {ws_port}; // Use the configured WebSocket port
-                        this.initializeComponents();
-                        this.setupEventListeners();
-                        this.connectWebSocket();
-                    }}
-                    
-                    initializeComponents() {{
-                        this.screenImg = document.getElementById('screen');
-                        this.connectionStatus = document.getElementById('connection-status');
-                        this.statusIndicator = document.getElementById('status-indicator');
-                        this.latencyInfo = document.getElementById('latency-info');
-                        this.eventLog = document.getElementById('event-log');
-                        this.qualitySlider = document.getElementById('quality-slider');
-                        this.qualityValue = document.getElementById('quality-value');
-                        this.fpsSelect = document.getElementById('fps-select');
-                    }}
-                    
-                    setupEventListeners() {{
-                        // Screen interactions
-                        this.screenImg.addEventListener('contextmenu', e => e.preventDefault());
-                        this.screenImg.addEventListener('mousedown', this.handleMouseDown.bind(this));
-                        this.screenImg.addEventListener('dblclick', this.handleDoubleClick.bind(this));
-                        this.screenImg.addEventListener('mousemove', this.handleMouseMove.bind(this));
-                        this.screenImg.addEventListener('wheel', this.handleWheel.bind(this));
-                        
-                        // Keyboard events
-                        document.addEventListener('keydown', this.handleKeyDown.bind(this));
-                        
-                        // Control buttons
-                        document.getElementById('left-click-btn').addEventListener('click', () => this.sendClick('left'));
-                        document.getElementById('right-click-btn').addEventListener('click', () => this.sendClick('right'));
-                        document.getElementById('auto-click-btn').addEventListener('click', this.toggleAutoClick.bind(this));
-                        document.getElementById('reconnect-btn').addEventListener('click', () => this.connectWebSocket());
-                        
-                        // Performance controls
-                        this.qualitySlider.addEventListener('input', this.updateQuality.bind(this));
-                        this.fpsSelect.addEventListener('change', this.updateFPS.bind(this));
-                    }}
-                    
-                    connectWebSocket() {{
-                        const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-                        const wsUrl = `${{protocol}}//${{window.location.hostname}}:${{this.wsPort}}`;
-                        
-                        this.ws = new WebSocket(wsUrl);
-                        this.ws.binaryType = 'arraybuffer';
-                        
-                        this.ws.onopen = () => {{
-                            this.connected = true;
-                            this.updateConnectionStatus('Connected', true);
-                            this.startLatencyCheck();
-                        }};
-                        
-                        this.ws.onmessage = (event) => {{
-                            if (event.data instanceof ArrayBuffer) {{
-                                this.handleFrameData(event.data);
-                            }} else {{
-                                this.handleJsonMessage(JSON.parse(event.data));
-                            }}
-                        }};
-                        
-                        this.ws.onclose = () => {{
-                            this.connected = false;
-                            this.updateConnectionStatus('Disconnected', false);
-                            setTimeout(() => this.connectWebSocket(), 2000);
-                        }};
-                        
-                        this.ws.onerror = (error) => {{
-                            console.error('WebSocket Error:', error);
-                        }};
-                    }}
-                    
-                    handleFrameData(arrayBuffer) {{
-                        const blob = new Blob([arrayBuffer], {{ type: 'image/jpeg' }});
-                        const url = URL.createObjectURL(blob);
-                        
-                        this.screenImg.src = url;
-                        //console.log(this.screenImg.src)
-
-                        if (this.screenImg.currentSrc) {{
-                            URL.revokeObjectURL(this.screenImg.currentSrc);
-                        }}
-                    }}
-                    
-                    handleJsonMessage(data) {{
-                        if (data.type === 'pong') {{
-                            const latency = Math.round(performance.now() - this.lastPingTime);
-                            this.latencyInfo.textContent = latency;
-                        }} else if (data.type === 'screen_size') {{
-                            this.screenWidth = data.width;
-                            this.screenHeight = data.height;
-                        }} else {{
-                            this.addLogEntry(data);
-                        }}
-                    }}
-
-                    handleMouseDown(e) {{
-                        e.preventDefault();
-                        const coords = this.getScreenCoordinates(e);
-                        const button = e.button === 0 ? 'left' : 'right';
-
-                        this.sendCommand({{
-                            type: 'control',
-                            action: 'click',
-                            x: coords.x,
-                            y: coords.y,
-                            button: button
-                        }});
-                    }}
-
-                    handleDoubleClick(e) {{
-                        e.preventDefault();
-                        const coords = this.getScreenCoordinates(e);
-
-                        this.sendCommand({{
-                            type: 'control',
-                            action: 'double_click',
-                            x: coords.x,
-                            y: coords.y
-                        }});
-                    }}
-
-                    handleMouseMove(e) {{
-                        const coords = this.getScreenCoordinates(e);
-
-                        if (!this.lastMoveTime || Date.now() - this.lastMoveTime > 50) {{
-                            this.lastMoveTime = Date.now();
-                            this.sendCommand({{
-                                type: 'control',
-                                action: 'move',
-                                x: coords.x,
-                                y: coords.y
-                            }});
-                        }}
-                    }}
-
-                    handleWheel(e) {{
-                        e.preventDefault();
-                        const coords = this.getScreenCoordinates(e);
-                        const deltaY = e.deltaY > 0 ? 1 : -1;
-
-                        this.sendCommand({{
-                            type: 'control',
-                            action: 'scroll',
-                            x: coords.x,
-                            y: coords.y,
-                            dy: deltaY
-                        }});
-                    }}
-
-                    handleKeyDown(e) {{
-                        if (e.key.toLowerCase() === 'end') {{
-                            e.preventDefault();
-                            return;
-                        }}
-
-                        this.sendCommand({{
-                            type: 'control',
-                            action: 'key',
-                            key: e.key
-                        }});
-                    }}
-
-                    getScreenCoordinates(e) {{
-                        const rect = this.screenImg.getBoundingClientRect();
-                        const scaleX = this.screenWidth / rect.width;
-                        const scaleY = this.screenHeight / rect.height;
-
-                        return {{
-                            x: Math.round((e.clientX - rect.left) * scaleX),
-                            y: Math.round((e.clientY - rect.top) * scaleY)
-                        }};
-                    }}
-
-                    sendCommand(command) {{
-                        if (this.connected) {{
-                            this.ws.send(JSON.stringify(command));
-                        }}
-                    }}
-
-                    sendClick(button) {{
-                        this.sendCommand({{
-                            type: 'control',
-                            action: 'click',
-                            button: button
-                        }});
-                    }}
-
-                    toggleAutoClick() {{
-                        this.autoClickActive = !this.autoClickActive;
-                        const btn = document.getElementById('auto-click-btn');
-
-                        if (this.autoClickActive) {{
-                            btn.classList.remove('btn-success');
-                            btn.classList.add('btn-danger');
-                            btn.innerHTML = '<i class="fas fa-stop me-2"></i>Stop Auto Click';
-                            this.sendCommand({{ type: 'command', action: 'start_auto_click' }});
-                        }} else {{
-                            btn.classList.remove('btn-danger');
-                            btn.classList.add('btn-success');
-                            btn.innerHTML = '<i class="fas fa-robot me-2"></i>Auto Click';
-                            this.sendCommand({{ type: 'command', action: 'stop_auto_click' }});
-                        }}
-                    }}
-
-                    updateQuality() {{
-                        const quality = this.qualitySlider.value;
-                        this.qualityValue.textContent = quality + '%';
-                        this.sendCommand({{
-                            type: 'command',
-                            action: 'set_quality',
-                            quality: parseInt(quality)
-                        }});
-                    }}
-
-                    updateFPS() {{
-                        const fps = this.fpsSelect.value;
-                        this.sendCommand({{
-                            type: 'command',
-                            action: 'set_fps',
-                            fps: parseInt(fps)
-                        }});
-                    }}
-
-                    updateConnectionStatus(status, connected) {{
-                        this.connectionStatus.textContent = status;
-                        this.statusIndicator.className = `status-indicator ${{connected ? 'status-connected' : 'status-disconnected'}}`;
-                    }}
-
-                    addLogEntry(data) {{
-                        const entry = document.createElement('div');
-                        entry.className = `log-entry ${{data.type}}`;
-                        entry.textContent = `[${{data.timestamp}}] ${{data.type.toUpperCase()}}: ${{JSON.stringify(data.details)}}`;
-
-                        this.eventLog.appendChild(entry);
-                        this.eventLog.scrollTop = this.eventLog.scrollHeight;
-
-                        // Keep only last 100 entries
-                        while (this.eventLog.childNodes.length > 100) {{
-                            this.eventLog.removeChild(this.eventLog.firstChild);
-                        }}
-                    }}
-
-                    startLatencyCheck() {{
-                        setInterval(() => {{
-                            if (this.connected) {{
-                                this.lastPingTime = performance.now();
-                                this.sendCommand({{ type: 'ping' }});
-                            }}
-                        }}, 2000);
-                    }}
-                }}
-
-                // Initialize the application
-                document.addEventListener('DOMContentLoaded', () => {{
-                    new RemoteDesktopClient();
-                }});
-            </script>
+            <script src="{js_url}"></script>
         </body>
         </html>
         """
 
+
+def _encode_variants(text: str) -> Tuple[bytes, bytes, Optional[bytes]]:
+    """Text as (UTF-8 bytes, gzip bytes, brotli bytes or None)"""
+    raw = text.encode('utf-8')
+    br = brotli.compress(raw, quality=11) if BROTLI_AVAILABLE else None
+    return raw, gzip.compress(raw, 9), br
+
+
+def _build_static_assets() -> Dict[str, Tuple[bytes, bytes, Optional[bytes], str]]:
+    """Hashed file name -> (UTF-8 bytes, gzip bytes, brotli bytes or None, content type)"""
+    assets = {}
+    for stem, ext, text, content_type in (
+        ('app', 'css', _APP_CSS, 'text/css'),
+        ('app', 'js', _APP_JS, 'application/javascript'),
+    ):
+        raw, gz, br = _encode_variants(text)
+        assets[f'{stem}.{hashlib.sha256(raw).hexdigest()[:8]}.{ext}'] = (raw, gz, br, content_type)
+    return assets
+
+
+# Built once at import; the hash in each name changes whenever its content does
+_STATIC_ASSETS = _build_static_assets()
+_CSS_URL, _JS_URL = (f'/static/{name}' for name in _STATIC_ASSETS)
+
+
+@functools.lru_cache(maxsize=None)
+def _render_page(ws_port: int) -> Tuple[bytes, bytes, Optional[bytes], str]:
+    """Rendered page for a WebSocket port as (UTF-8 bytes, gzip bytes, brotli bytes or None, ETag), computed once per port"""
+    html = _HTML_TEMPLATE.format(ws_port=ws_port, css_url=_CSS_URL, js_url=_JS_URL, **_ICON_MARKUP)
+    html_bytes, html_gz, html_br = _encode_variants(html)
+    return html_bytes, html_gz, html_br, f'"{hashlib.md5(html_bytes).hexdigest()}"'
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """Accept-Encoding header as {content coding: q-value}; browsers send a handful of distinct values"""
+    qvalues = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding] = q
+    return qvalues
+
+
+def _negotiated_response(request: web.Request, raw: bytes, gz: bytes, br: Optional[bytes],
+                         content_type: str, headers: dict) -> Response:
+    """Response with the most preferred body encoding the client accepts (q=0 refuses a coding)"""
+    qvalues = _parse_accept_encoding(request.headers.get('Accept-Encoding', ''))
+    default_q = qvalues.get('*', 0.0)
+    br_q = qvalues.get('br', default_q) if br is not None else 0.0
+    gzip_q = qvalues.get('gzip', default_q)
+
+    # On equal preference brotli wins, being the smaller body
+    if br_q > 0 and br_q >= gzip_q:
+        headers['Content-Encoding'] = 'br'
+        return Response(body=br, content_type=content_type, charset='utf-8', headers=headers)
+    if gzip_q > 0:
+        headers['Content-Encoding'] = 'gzip'
+        return Response(body=gz, content_type=content_type, charset='utf-8', headers=headers)
+    return Response(body=raw, content_type=content_type, charset='utf-8', headers=headers)
+
+
+# Load the system MIME tables once at import rather than on the first download
+mimetypes.init()
+
+
+@functools.lru_cache(maxsize=256)
+def _content_type(ext: str) -> str:
+    """Content-Type for a lower-cased file extension"""
+    return mimetypes.types_map.get(ext, 'application/octet-stream')
+
+
+class WebInterface:
+    """Enterprise-grade web interface with responsive design"""
+    def __init__(self, config: SystemConfig):
+        self.config = config
+
     async def handle_http_request(self, request: web.Request) -> Response:
         """Handle HTTP requests"""
-        return Response(text=self.html_content, content_type='text/html')
+        # Looked up per request: the server may settle on a fallback WebSocket port after construction
+        html_bytes, html_gz, html_br, html_etag = _render_page(self.config.server.ws_port)
+
+        # The ETag lets reloads revalidate with a 304 instead of downloading the page again
+        headers = {'ETag': html_etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+        if request.headers.get('If-None-Match') == html_etag:
+            return Response(status=304, headers=headers)
+
+        return _negotiated_response(request, html_bytes, html_gz, html_br, 'text/html', headers)
+
+    async def handle_static(self, request: web.Request) -> Response:
+        """Serve the page stylesheet and script"""
+        asset = _STATIC_ASSETS.get(request.match_info['name'])
+        if asset is None:
+            return Response(text="Not found", status=404)
+
+        raw, gz, br, content_type = asset
+        # The name carries a content hash, so a cached copy never needs revalidating
+        headers = {'Cache-Control': 'public, max-age=31536000, immutable', 'Vary': 'Accept-Encoding'}
+        return _negotiated_response(request, raw, gz, br, content_type, headers)
 
     async def handle_file(self, request: web.Request) -> Response:
         """Handle file transfer requests"""
         # Basic file transfer implementation
         try:
             file_path = request.query.get('path', '')
-            if not file_path or not os.path.exists(file_path):
+            if not file_path:
                 return Response(text="File not found", status=404)
 
-            with open(file_path, 'rb') as f:
-                content = f.read()
+            # Resolve and stat() off the event loop; slow or network filesystems can block
+            status, file_path = await asyncio.get_running_loop().run_in_executor(None, self._resolve_file, file_path)
+            if status == 403:
+                return Response(text="Access denied", status=403)
+            if status == 404:
+                return Response(text="File not found", status=404)
 
             # Get file extension for content type
             ext = os.path.splitext(file_path)[1].lower()
-            content_type = {
-                '.txt': 'text/plain',
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.png': 'image/png',
-                '.pdf': 'application/pdf',
-                '.zip': 'application/zip',
-            }.get(ext, 'application/octet-stream')
-
-            return Response(body=content, content_type=content_type)
+            content_type = _content_type(ext)
+
+            # Streamed with sendfile() where available instead of being read into memory
+            return FileResponse(file_path, headers={'Content-Type': content_type})
         except Exception as e:
             print(f"File transfer error: {e}")
-            return Response(text="Error retrieving file", status=500)
\ No newline at end of file
+            return Response(text="Error retrieving file", status=500)
+
+    def _resolve_file(self, file_path: str) -> Tuple[int, str]:
+        """Resolve a requested path inside the file transfer root as (HTTP status, real path)"""
+        root = os.path.realpath(self.config.features.file_transfer_root)
+        real_path = os.path.realpath(os.path.join(root, file_path))
+        try:
+            # Rejects ../ traversal, absolute paths and symlinks leading outside the root
+            if os.path.commonpath([root, real_path]) != root:
+                return 403, real_path
+        except ValueError:
+            # Different drives on Windows
+            return 403, real_path
+
+        try:
+            st = os.stat(real_path)
+        except OSError:
+            return 404, real_path
+        return (200 if stat.S_ISREG(st.st_mode) else 404), real_path
\ No newline at end of file